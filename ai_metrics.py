@@ -0,0 +1,210 @@
+import os
+import time
+import atexit
+import sqlite3
+import bisect
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# Histogram bin upper bounds per unit; the last bin is open-ended
+LATENCY_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 60000)
+SIZE_BOUNDS = (10, 30, 100, 300, 1000, 3000, 10000, 30000, 100000, 300000, 1000000, 3000000)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS histogram_bins (
+    metric TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    bin INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (metric, hour, bin)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS histogram_totals (
+    metric TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    total REAL NOT NULL,
+    max REAL NOT NULL,
+    PRIMARY KEY (metric, hour)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (name, hour)
+) WITHOUT ROWID;
+"""
+
+def bounds_for(metric: str) -> tuple:
+    """Bins used for a metric: latency bins for *_ms metrics, size bins otherwise"""
+    return LATENCY_BOUNDS_MS if metric.endswith("_ms") else SIZE_BOUNDS
+
+
+class AIMetrics:
+    """Rolling hourly histograms and counters for the AI pipeline, persisted in SQLite.
+
+    Observations are aggregated in memory and flushed at most every
+    FLUSH_SECONDS, so recording stays off the request's critical path.
+    """
+
+    FLUSH_SECONDS = 5.0
+    RETENTION_HOURS = 24 * 7
+
+    def __init__(self, db_path: str = "data/ai_metrics.db"):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._bins = {}      # (metric, hour, bin) -> count
+        self._totals = {}    # (metric, hour) -> [count, total, max]
+        self._counters = {}  # (name, hour) -> count
+        self._last_flush = time.monotonic()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        """Open a short-lived connection (flushes are infrequent)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def _hour(now: Optional[float] = None) -> int:
+        """Hour bucket of a wall-clock time"""
+        return int((now if now is not None else time.time()) // 3600)
+
+    def observe(self, metric: str, value: float):
+        """Record one value (latency in ms for *_ms metrics, otherwise a size or count)"""
+        hour = self._hour()
+        bin_index = bisect.bisect_left(bounds_for(metric), value)
+        with self._lock:
+            self._bins[(metric, hour, bin_index)] = self._bins.get((metric, hour, bin_index), 0) + 1
+            totals = self._totals.setdefault((metric, hour), [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += value
+            totals[2] = max(totals[2], value)
+        self._maybe_flush()
+
+    def increment(self, name: str, amount: int = 1):
+        """Add to a counter (cache hits, failures by reason, ...)"""
+        if not amount:
+            return
+        key = (name, self._hour())
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+        self._maybe_flush()
+
+    @contextmanager
+    def timer(self, metric: str):
+        """Observe the wall time of the with-block in milliseconds"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(metric, (time.perf_counter() - started) * 1000)
+
+    def _maybe_flush(self):
+        """Flush if the last flush is older than FLUSH_SECONDS"""
+        if time.monotonic() - self._last_flush >= self.FLUSH_SECONDS:
+            self.flush()
+
+    def flush(self):
+        """Write buffered data to SQLite and drop buckets past the retention window"""
+        with self._flush_lock:
+            with self._lock:
+                bins, totals, counters = self._bins, self._totals, self._counters
+                self._bins, self._totals, self._counters = {}, {}, {}
+                self._last_flush = time.monotonic()
+            if not (bins or totals or counters):
+                return
+
+            try:
+                with self._connect() as conn:
+                    conn.executemany(
+                        "INSERT INTO histogram_bins (metric, hour, bin, count) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT (metric, hour, bin) DO UPDATE SET count = count + excluded.count",
+                        [(metric, hour, bin_index, count) for (metric, hour, bin_index), count in bins.items()]
+                    )
+                    conn.executemany(
+                        "INSERT INTO histogram_totals (metric, hour, count, total, max) VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT (metric, hour) DO UPDATE SET count = count + excluded.count, "
+                        "total = total + excluded.total, max = MAX(max, excluded.max)",
+                        [(metric, hour, *values) for (metric, hour), values in totals.items()]
+                    )
+                    conn.executemany(
+                        "INSERT INTO counters (name, hour, count) VALUES (?, ?, ?) "
+                        "ON CONFLICT (name, hour) DO UPDATE SET count = count + excluded.count",
+                        [(name, hour, count) for (name, hour), count in counters.items()]
+                    )
+                    cutoff = self._hour() - self.RETENTION_HOURS
+                    for table in ("histogram_bins", "histogram_totals", "counters"):
+                        conn.execute(f"DELETE FROM {table} WHERE hour < ?", (cutoff,))
+            except Exception as e:
+                print(f"Error writing AI metrics: {e}")
+
+    def summary(self, hours: int = 24) -> Dict[str, Dict]:
+        """Aggregate the last `hours` hours.
+
+        Returns {"histograms": {metric: {count, mean, p50, p95, max}}, "counters": {name: count}}.
+        Percentiles are the upper bound of the bin holding that rank.
+        """
+        self.flush()
+        since = self._hour() - hours + 1
+
+        with self._connect() as conn:
+            totals = conn.execute(
+                "SELECT metric, SUM(count), SUM(total), MAX(max) FROM histogram_totals "
+                "WHERE hour >= ? GROUP BY metric", (since,)
+            ).fetchall()
+            bin_rows = conn.execute(
+                "SELECT metric, bin, SUM(count) FROM histogram_bins WHERE hour >= ? "
+                "GROUP BY metric, bin ORDER BY metric, bin", (since,)
+            ).fetchall()
+            counter_rows = conn.execute(
+                "SELECT name, SUM(count) FROM counters WHERE hour >= ? GROUP BY name", (since,)
+            ).fetchall()
+
+        bins_by_metric = {}
+        for metric, bin_index, count in bin_rows:
+            bins_by_metric.setdefault(metric, []).append((bin_index, count))
+
+        histograms = {}
+        for metric, count, total, max_value in totals:
+            bounds = bounds_for(metric)
+
+            def percentile(p):
+                rank = p * count
+                seen = 0
+                for bin_index, bin_count in bins_by_metric.get(metric, []):
+                    seen += bin_count
+                    if seen >= rank:
+                        return min(bounds[bin_index], max_value) if bin_index < len(bounds) else max_value
+                return max_value
+
+            histograms[metric] = {
+                "count": count,
+                "mean": total / count if count else 0.0,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": max_value,
+            }
+
+        return {"histograms": histograms, "counters": dict(counter_rows)}
+
+
+_ai_metrics = None
+_ai_metrics_lock = threading.Lock()
+
+def get_ai_metrics() -> AIMetrics:
+    """Get the process-wide metrics recorder (flushed again at exit)"""
+    global _ai_metrics
+    with _ai_metrics_lock:
+        if _ai_metrics is None:
+            _ai_metrics = AIMetrics(os.getenv("ZOO_AI_METRICS_PATH", "data/ai_metrics.db"))
+            atexit.register(_ai_metrics.flush)
+    return _ai_metrics
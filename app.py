@@ -2,9 +2,6 @@ import streamlit as st
 import os
 from datetime import datetime
 from auth import authenticate_user, get_user_role
-from components.admin_interface import show_admin_interface
-from components.doctor_interface import show_doctor_interface
-from components.zookeeper_interface import show_zookeeper_interface
 
 # Configure page
 st.set_page_config(
@@ -245,12 +242,15 @@ def show_main_interface():
         st.markdown("### System Info")
         st.info(f"Current Date: {datetime.now().strftime('%Y-%m-%d')}")
     
-    # Main content based on role
+    # Main content based on role (interfaces are imported only for the role in use)
     if st.session_state.user_role == 'zookeeper':
+        from components.zookeeper_interface import show_zookeeper_interface
         show_zookeeper_interface()
     elif st.session_state.user_role == 'doctor':
+        from components.doctor_interface import show_doctor_interface
         show_doctor_interface()
     elif st.session_state.user_role == 'admin':
+        from components.admin_interface import show_admin_interface
         show_admin_interface()
 
 def main():
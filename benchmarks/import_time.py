@@ -0,0 +1,58 @@
+"""Cold-start import benchmark.
+
+Each case runs in a fresh interpreter, so module caches never help. The
+"deferred" row is the AI stack cost that used to be paid at import time and
+is now only paid when the model is first used.
+
+Run from the project root:
+    python benchmarks/import_time.py [--runs 5]
+"""
+import os
+import sys
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    ("zoo_model (import only)", "import zoo_model"),
+    ("zoo_model + first use (deferred)", "import zoo_model; zoo_model.get_zoo_model()"),
+    ("AI stack (genai)", "import google.generativeai"),
+    ("login page modules (app start)", "import streamlit, auth"),
+    ("components.zookeeper_interface", "import components.zookeeper_interface"),
+    ("components.doctor_interface", "import components.doctor_interface"),
+    ("components.admin_interface", "import components.admin_interface"),
+]
+
+TIMER = (
+    "import time, warnings; warnings.simplefilter('ignore'); start = time.perf_counter(); {code}; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+def time_case(code, runs):
+    """Best-of-runs wall time (ms) of code in a fresh interpreter"""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            cwd=ROOT, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import times")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per case (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'case':<40} {'best ms':>10}")
+    for label, code in CASES:
+        try:
+            print(f"{label:<40} {time_case(code, args.runs):>10.1f}")
+        except Exception as e:
+            print(f"{label:<40} {'error':>10}  {e}")
+
+if __name__ == "__main__":
+    main()
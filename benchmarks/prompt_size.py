@@ -0,0 +1,72 @@
+"""Extraction prompt size benchmark.
+
+Compares the old prompt (langchain template with the full JSON schema dump
+from PydanticOutputParser) with the compact prompt built by zoo_model.
+Token counts come from Gemini's count_tokens when GOOGLE_API_KEY is set,
+otherwise they are estimated at 4 characters per token.
+
+Run from the project root:
+    python benchmarks/prompt_size.py
+"""
+import os
+import sys
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+warnings.simplefilter("ignore")
+
+from zoo_model import AnimalMonitoringData, build_prompt
+
+SAMPLES = [
+    ("2025-01-15", "शेर सुबह समय पर दिखा, पानी साफ था, बाड़े की सफाई हुई और खाना निर्धारित मात्रा में दिया गया।"),
+    ("2025-01-15", "Tiger was limping on the left hind leg and refused half of its meat. Water was refilled."),
+]
+
+LEGACY_TEMPLATE = """
+                You are an animal monitoring assistant.
+                Given the input observation, return structured monitoring data
+                in valid JSON format that matches the schema.
+
+                {format_instructions}
+
+                ONLY return a JSON object, no extra text, no code, no comments.
+
+                Observation: {observation}
+            """
+
+def legacy_prompt(observation_text, date):
+    """The prompt as it was rendered before the compact builder (needs langchain)"""
+    from langchain.output_parsers import PydanticOutputParser
+    instructions = PydanticOutputParser(pydantic_object=AnimalMonitoringData).get_format_instructions()
+    return LEGACY_TEMPLATE.format(
+        format_instructions=instructions,
+        observation=f"Date: {date}\nObservation: {observation_text}"
+    )
+
+def token_counter():
+    """Gemini token counter if an API key is configured, else a 4-characters-per-token estimate"""
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if api_key:
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+        model = genai.GenerativeModel("gemini-2.5-flash")
+        return lambda text: model.count_tokens(text).total_tokens, "tokens"
+    return lambda text: round(len(text) / 4), "~tokens"
+
+def main():
+    count_tokens, unit = token_counter()
+    builders = [("compact", build_prompt)]
+    try:
+        legacy_prompt(*reversed(SAMPLES[0]))
+        builders.insert(0, ("legacy", legacy_prompt))
+    except ImportError:
+        print("langchain not installed; showing the compact prompt only\n")
+
+    print(f"{'prompt':<10} {'sample':>6} {'chars':>8} {unit:>8}")
+    for label, build in builders:
+        for index, (date, text) in enumerate(SAMPLES, 1):
+            prompt = build(text, date)
+            print(f"{label:<10} {index:>6} {len(prompt):>8} {count_tokens(prompt):>8}")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 import streamlit as st
 from datetime import datetime, date, timedelta
-from data_manager import data_manager
+from components.data_cache import data_manager
 from auth import add_user, load_users
+from components.pagination import get_observation_page, show_page_controls, observation_summary, select_observation
+from components.report_export import show_bulk_export, spool_to_file
+from system_export import stream_export, export_filename
 import json
 import os
 
@@ -31,15 +34,19 @@ def show_admin_overview():
     """Show admin dashboard overview"""
     st.header("📊 System Overview")
     
-    # Get all system data
-    all_observations = data_manager.get_all_observations()
+    # Get all system data (precomputed counters; cost does not grow with history)
+    totals = data_manager.get_rollup_totals()
     users_data = load_users()
     
+    # Last 7 days, oldest first
+    week_dates = [(date.today() - timedelta(days=i)).strftime("%Y-%m-%d") for i in reversed(range(7))]
+    week_rollups = data_manager.get_daily_rollups(week_dates[0], week_dates[-1])
+    
     # Metrics row 1
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Observations", len(all_observations))
+        st.metric("Total Observations", totals["observations"])
     
     with col2:
         total_users = sum(len(role_users) for role_users in users_data.values())
@@ -47,57 +54,38 @@ def show_admin_overview():
     
     with col3:
         # Observations today
-        today = date.today().strftime("%Y-%m-%d")
-        today_obs = [obs for obs in all_observations if obs.get("date") == today]
-        st.metric("Today's Observations", len(today_obs))
+        today = week_dates[-1]
+        st.metric("Today's Observations", week_rollups.get(today, {}).get("observations", 0))
     
     with col4:
         # Total comments
-        comment_count = 0
-        for obs in all_observations:
-            comments = data_manager.get_comments(obs.get("date", ""), obs.get("username", ""))
-            comment_count += len(comments)
-        st.metric("Total Comments", comment_count)
+        st.metric("Total Comments", totals["comments"])
     
     st.markdown("---")
     
     # Recent activity
     st.subheader("📈 Recent Activity")
     
-    # Last 7 days activity
-    recent_observations = []
-    for i in range(7):
-        check_date = (date.today() - timedelta(days=i)).strftime("%Y-%m-%d")
-        day_obs = [obs for obs in all_observations if obs.get("date") == check_date]
-        recent_observations.append({
-            "date": check_date,
-            "count": len(day_obs)
-        })
-    
-    # Display as chart
-    if recent_observations:
-        chart_data = {"Date": [], "Observations": []}
-        for item in reversed(recent_observations):  # Reverse to show oldest first
-            chart_data["Date"].append(item["date"])
-            chart_data["Observations"].append(item["count"])
-        
-        st.line_chart(data=chart_data, x="Date", y="Observations")
+    # Last 7 days activity, as chart
+    chart_data = {"Date": [], "Observations": []}
+    for check_date in week_dates:
+        chart_data["Date"].append(check_date)
+        chart_data["Observations"].append(week_rollups.get(check_date, {}).get("observations", 0))
+    
+    st.line_chart(data=chart_data, x="Date", y="Observations")
     
     # User activity breakdown
     st.subheader("👥 User Activity")
     
-    user_activity = {}
-    for obs in all_observations:
-        username = obs.get("username", "Unknown")
-        user_activity[username] = user_activity.get(username, 0) + 1
+    user_activity = data_manager.get_keeper_rollups()
     
     if user_activity:
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**Observations per Zoo Keeper:**")
-            for username, count in sorted(user_activity.items(), key=lambda x: x[1], reverse=True):
-                st.write(f"• {username}: {count} observations")
+            for keeper in user_activity:
+                st.write(f"• {keeper['username'] or 'Unknown'}: {keeper['observations']} observations")
         
         with col2:
             # Role distribution
@@ -182,18 +170,21 @@ def show_all_observations():
         )
     
     with col3:
-        all_observations = data_manager.get_all_observations()
-        all_keepers = list(set(obs.get("username", "") for obs in all_observations))
+        all_keepers = data_manager.get_keepers()
         selected_keeper = st.selectbox("Filter by Keeper", ["All"] + all_keepers)
     
-    # Get filtered observations
-    observations = data_manager.get_observations_by_date_range(
-        start_date.strftime("%Y-%m-%d"),
-        end_date.strftime("%Y-%m-%d")
-    )
+    # Filters shared by the list and the bulk export
+    filters = {
+        "start_date": start_date.strftime("%Y-%m-%d"),
+        "end_date": end_date.strftime("%Y-%m-%d"),
+        "username": None if selected_keeper == "All" else selected_keeper
+    }
     
-    if selected_keeper != "All":
-        observations = [obs for obs in observations if obs.get("username") == selected_keeper]
+    # Every report for these filters as one archive
+    show_bulk_export("admin_export", filters, generate_admin_report, "observation_reports")
+    
+    # Get the current page of filtered observations
+    observations = get_observation_page("admin_observations_pager", filters)
     
     if not observations:
         st.info("🔍 No observations found for the selected criteria.")
@@ -201,101 +192,109 @@ def show_all_observations():
     
     st.success(f"📊 Displaying {len(observations)} observations")
     
-    # Display observations with admin controls
-    for idx, obs in enumerate(observations):
-        obs_date = obs.get("date", "Unknown")
-        keeper_name = obs.get("username", "Unknown")
-        obs_time = obs.get("timestamp", "")
-        raw_obs = obs.get("raw_observation", "")
+    # Summary rows only; the full record and its comments are loaded for the selected row
+    selected = select_observation("admin_observations_pager", observations)
+    show_page_controls("admin_observations_pager")
+    
+    if selected:
+        show_observation_admin_details(*selected)
+
+def show_observation_admin_details(obs_date, keeper_name):
+    """Show one observation in full with admin comment, download and delete actions"""
+    obs = data_manager.get_observation(obs_date, keeper_name)
+    if obs is None:
+        st.info("🔍 This observation no longer exists.")
+        return
+    
+    raw_obs = obs.get("raw_observation", "")
+    structured_data = obs.get("structured_data", {})
+    comments = data_manager.get_comments(obs_date, keeper_name)
+    
+    with st.container(border=True):
+        st.markdown(f"**{observation_summary(obs, len(comments))}**")
         
-        with st.expander(f"📅 {obs_date} - {keeper_name} ({datetime.fromisoformat(obs_time).strftime('%H:%M') if obs_time else ''})"):
-            
-            col1, col2 = st.columns([3, 1])
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            st.markdown("**Observation:**")
+            st.text_area("", value=raw_obs, height=100, disabled=True, key=f"admin_obs_{obs_date}_{keeper_name}")
             
-            with col1:
-                st.markdown("**Observation:**")
-                st.text_area("", value=raw_obs, height=100, disabled=True, key=f"admin_obs_{idx}")
-                
-                # Admin comment section
-                admin_comment = st.text_area(
-                    "Admin Comments:",
-                    key=f"admin_comment_{obs_date}_{keeper_name}",
-                    placeholder="Add administrative notes, feedback, or instructions..."
-                )
-                
-                if st.button(f"💬 Add Admin Comment", key=f"admin_add_comment_{idx}"):
-                    if admin_comment.strip():
-                        success = data_manager.save_comment(
-                            obs_date,
-                            keeper_name,
-                            st.session_state.username,
-                            admin_comment,
-                            "admin"
-                        )
-                        
-                        if success:
-                            st.success("✅ Admin comment added!")
-                            st.rerun()
-                        else:
-                            st.error("❌ Error adding comment!")
-                    else:
-                        st.warning("⚠️ Please enter a comment!")
+            # Admin comment section
+            admin_comment = st.text_area(
+                "Admin Comments:",
+                key=f"admin_comment_{obs_date}_{keeper_name}",
+                placeholder="Add administrative notes, feedback, or instructions..."
+            )
             
-            with col2:
-                st.markdown("**Admin Actions:**")
-                
-                # Download observation
-                if st.button(f"📄 Download", key=f"admin_download_{idx}"):
-                    report_content = generate_admin_report(obs)
-                    st.download_button(
-                        label="📥 Download Report",
-                        data=report_content,
-                        file_name=f"observation_{obs_date}_{keeper_name}.txt",
-                        mime="text/plain",
-                        key=f"admin_dl_{idx}"
+            if st.button(f"💬 Add Admin Comment", key=f"admin_add_comment_{obs_date}_{keeper_name}"):
+                if admin_comment.strip():
+                    success = data_manager.save_comment(
+                        obs_date,
+                        keeper_name,
+                        st.session_state.username,
+                        admin_comment,
+                        "admin"
                     )
-                
-                # Delete observation
-                st.markdown("⚠️ **Danger Zone:**")
-                if st.button(f"🗑️ Delete", key=f"admin_delete_{idx}", type="secondary"):
-                    if data_manager.delete_observation(obs_date, keeper_name):
-                        st.success("✅ Observation deleted!")
+                    
+                    if success:
+                        st.success("✅ Admin comment added!")
                         st.rerun()
                     else:
-                        st.error("❌ Error deleting observation!")
+                        st.error("❌ Error adding comment!")
+                else:
+                    st.warning("⚠️ Please enter a comment!")
+        
+        with col2:
+            st.markdown("**Admin Actions:**")
             
-            # Show all comments
-            comments = data_manager.get_comments(obs_date, keeper_name)
-            if comments:
-                st.markdown("**All Comments:**")
-                for comment in comments:
-                    author = comment.get("comment_author", "Unknown")
-                    role = comment.get("author_role", "").title()
-                    text = comment.get("comment_text", "")
-                    timestamp = comment.get("timestamp", "")
-                    
-                    # Style based on role
-                    if role.lower() == "admin":
-                        st.error(f"**Admin {author}** - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
-                    elif role.lower() == "doctor":
-                        st.info(f"**Dr. {author}** - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
-                    else:
-                        st.markdown(f"**{author}** ({role}) - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
+            # Download observation
+            if st.button(f"📄 Download", key=f"admin_download_{obs_date}_{keeper_name}"):
+                report_content = generate_admin_report(obs, comments)
+                st.download_button(
+                    label="📥 Download Report",
+                    data=report_content,
+                    file_name=f"observation_{obs_date}_{keeper_name}.txt",
+                    mime="text/plain",
+                    key=f"admin_dl_{obs_date}_{keeper_name}"
+                )
+            
+            # Delete observation
+            st.markdown("⚠️ **Danger Zone:**")
+            if st.button(f"🗑️ Delete", key=f"admin_delete_{obs_date}_{keeper_name}", type="secondary"):
+                if data_manager.delete_observation(obs_date, keeper_name):
+                    st.success("✅ Observation deleted!")
+                    st.rerun()
+                else:
+                    st.error("❌ Error deleting observation!")
+        
+        # Show all comments
+        if comments:
+            st.markdown("**All Comments:**")
+            for comment in comments:
+                author = comment.get("comment_author", "Unknown")
+                role = comment.get("author_role", "").title()
+                text = comment.get("comment_text", "")
+                timestamp = comment.get("timestamp", "")
+                
+                # Style based on role
+                if role.lower() == "admin":
+                    st.error(f"**Admin {author}** - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
+                elif role.lower() == "doctor":
+                    st.info(f"**Dr. {author}** - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
+                else:
+                    st.markdown(f"**{author}** ({role}) - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
 
 def show_comment_management():
     """Show comment management interface"""
     st.header("💬 Comment Management")
     
     # Get all comments across all observations
-    all_observations = data_manager.get_all_observations()
     all_comments = []
     
-    for obs in all_observations:
-        comments = data_manager.get_comments(obs.get("date", ""), obs.get("username", ""))
-        for comment in comments:
-            comment["obs_date"] = obs.get("date", "")
-            comment["obs_keeper"] = obs.get("username", "")
-            all_comments.append(comment)
+    for comment in data_manager.iter_all_comments():
+        comment["obs_date"] = comment.get("observation_date", "")
+        comment["obs_keeper"] = comment.get("observation_username", "")
+        all_comments.append(comment)
     
     if not all_comments:
         st.info("💬 No comments found in the system.")
@@ -354,7 +353,7 @@ def show_system_settings():
     comments_dir = "data/comments"
     
     obs_files = len([f for f in os.listdir(obs_dir) if f.endswith('.json')]) if os.path.exists(obs_dir) else 0
-    comment_files = len([f for f in os.listdir(comments_dir) if f.endswith('.json')]) if os.path.exists(comments_dir) else 0
+    comment_files = len([f for f in os.listdir(comments_dir) if f.endswith(('.json', '.jsonl'))]) if os.path.exists(comments_dir) else 0
     
     col1, col2, col3 = st.columns(3)
     
@@ -377,42 +376,52 @@ def show_system_settings():
     # Backup and export
     st.subheader("💾 Data Management")
     
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
     
     with col1:
+        export_range = st.checkbox("Limit export to a date range", key="system_export_range")
+        export_start = export_end = None
+        if export_range:
+            export_start = st.date_input("Export From", value=date.today() - timedelta(days=30),
+                                         max_value=date.today(), key="system_export_start")
+            export_end = st.date_input("Export To", value=date.today(),
+                                       max_value=date.today(), key="system_export_end")
+        
         if st.button("📥 Export All Data", use_container_width=True):
-            export_data = {
-                "observations": data_manager.get_all_observations(),
-                "users": load_users(),
-                "export_timestamp": datetime.now().isoformat()
-            }
+            start = export_start.strftime("%Y-%m-%d") if export_start else None
+            end = export_end.strftime("%Y-%m-%d") if export_end else None
             
-            st.download_button(
-                label="📥 Download System Export",
-                data=json.dumps(export_data, indent=2),
-                file_name=f"zoo_system_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
-            )
+            # Observations, comments and users streamed as gzip NDJSON into a temporary file
+            with st.spinner("Exporting..."):
+                export_file = spool_to_file(stream_export(start, end))
+            
+            with export_file:
+                st.download_button(
+                    label="📥 Download System Export",
+                    data=export_file,
+                    file_name=export_filename(start, end),
+                    mime="application/gzip",
+                    on_click="ignore"
+                )
     
     with col2:
+        if st.button("🗜️ Compact Comment Logs", use_container_width=True):
+            compacted = data_manager.compact_comments()
+            st.success(f"✅ Compacted {compacted} comment threads")
+    
+    with col3:
         if st.button("🧹 Clean Old Data", use_container_width=True):
             st.warning("Data cleanup functionality would be implemented here.")
     
     st.markdown("---")
     
-    # AI Model settings
-    st.subheader("🤖 AI Model Configuration")
-    
-    # Show current model status
-    api_token = os.getenv("HUGGINGFACEHUB_API_TOKEN")
-    if api_token:
-        st.success("✅ Hugging Face API token configured")
-    else:
-        st.error("❌ Hugging Face API token not found")
+    # AI pipeline status and performance
+    show_ai_performance()
     
     # Model test
     if st.button("🧪 Test AI Model"):
-        from zoo_model import zoo_model
+        from zoo_model import get_zoo_model
+        zoo_model = get_zoo_model()
         test_observation = "Test observation: Animals are active and healthy today."
         
         try:
@@ -424,6 +433,87 @@ def show_system_settings():
         except Exception as e:
             st.error(f"❌ AI model test failed: {str(e)}")
 
+def _rate(hits, misses):
+    """Hit rate as a percentage string"""
+    total = hits + misses
+    return f"{hits / total * 100:.0f}%" if total else "—"
+
+def show_ai_performance():
+    """Show AI service configuration and recorded pipeline metrics"""
+    st.subheader("🤖 AI Performance")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if os.getenv("GOOGLE_API_KEY"):
+            st.success("✅ Gemini API key configured")
+        else:
+            st.error("❌ Gemini API key not found (GOOGLE_API_KEY)")
+    with col2:
+        if os.getenv("DEEPGRAM_API_KEY"):
+            st.success("✅ Deepgram API key configured")
+        else:
+            st.error("❌ Deepgram API key not found (DEEPGRAM_API_KEY)")
+    
+    windows = {"Last hour": 1, "Last 24 hours": 24, "Last 7 days": 24 * 7}
+    window = st.selectbox("Window", list(windows), index=1, key="ai_metrics_window")
+    
+    # ai_metrics is light; reading it does not load the AI stack
+    from ai_metrics import get_ai_metrics
+    summary = get_ai_metrics().summary(hours=windows[window])
+    histograms, counters = summary["histograms"], summary["counters"]
+    
+    if not histograms and not counters:
+        st.info("No AI activity recorded in this window.")
+        return
+    
+    failures = {name: count for name, count in counters.items() if ".failure." in name}
+    fallbacks = sum(count for name, count in counters.items() if name.startswith("extract.fallback."))
+    extractions = histograms.get("extract.total_ms", {}).get("count", 0)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Extractions", extractions)
+    with col2:
+        st.metric("Fast Path", _rate(counters.get("fast_path.hit", 0), counters.get("fast_path.miss", 0)))
+    with col3:
+        st.metric("LLM Cache Hits", _rate(counters.get("llm_cache.hit", 0), counters.get("llm_cache.miss", 0)))
+    with col4:
+        st.metric("Fallbacks", fallbacks)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Transcriptions", histograms.get("transcribe.preprocess_ms", {}).get("count", 0))
+    with col2:
+        st.metric("Transcript Cache Hits",
+                  _rate(counters.get("transcript_cache.hit", 0), counters.get("transcript_cache.miss", 0)))
+    with col3:
+        st.metric("HTTP Retries", counters.get("transcribe.retries", 0))
+    with col4:
+        st.metric("Failures", sum(failures.values()))
+    
+    st.write("**Latency (ms)**")
+    latency_rows = [
+        {"Stage": metric, "Count": values["count"], "Mean": round(values["mean"], 1),
+         "p50": round(values["p50"], 1), "p95": round(values["p95"], 1), "Max": round(values["max"], 1)}
+        for metric, values in sorted(histograms.items()) if metric.endswith("_ms")
+    ]
+    st.dataframe(latency_rows, use_container_width=True, hide_index=True)
+    
+    st.write("**Sizes (characters, bytes and tokens)**")
+    size_rows = [
+        {"Metric": metric, "Count": values["count"], "Mean": round(values["mean"]),
+         "p50": round(values["p50"]), "p95": round(values["p95"]), "Max": round(values["max"])}
+        for metric, values in sorted(histograms.items()) if not metric.endswith("_ms")
+    ]
+    st.dataframe(size_rows, use_container_width=True, hide_index=True)
+    
+    if failures:
+        st.write("**Failures by reason**")
+        st.dataframe(
+            [{"Reason": name, "Count": count} for name, count in sorted(failures.items(), key=lambda item: -item[1])],
+            use_container_width=True, hide_index=True
+        )
+
 def remove_user(username, role):
     """Remove user from the system"""
     try:
@@ -441,8 +531,8 @@ def remove_user(username, role):
         print(f"Error removing user: {e}")
         return False
 
-def generate_admin_report(obs):
-    """Generate admin report for observation"""
+def generate_admin_report(obs, comments=None):
+    """Generate admin report for observation (comments are fetched if not supplied)"""
     structured_data = obs.get("structured_data", {})
     
     report = f"""ADMINISTRATIVE OBSERVATION REPORT
@@ -468,7 +558,8 @@ ADMINISTRATIVE COMMENTS:
 """
     
     # Add admin comments
-    comments = data_manager.get_comments(obs.get('date', ''), obs.get('username', ''))
+    if comments is None:
+        comments = data_manager.get_comments(obs.get('date', ''), obs.get('username', ''))
     for comment in comments:
         if comment.get('author_role') == 'admin':
             author = comment.get('comment_author', 'Unknown')
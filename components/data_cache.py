@@ -0,0 +1,70 @@
+import threading
+import streamlit as st
+from collections.abc import Iterator
+from data_manager import data_manager as _data_manager
+
+# DataManager reads served from st.cache_data; everything else passes straight through
+CACHED_READS = frozenset({
+    "get_observation",
+    "get_all_observations",
+    "get_observations_by_date_range",
+    "get_observations_by_user",
+    "get_observations_by_animal",
+    "get_keepers",
+    "iter_observations",
+    "get_comments",
+    "get_comments_bulk",
+    "search_observations",
+    "get_rollup_totals",
+    "get_daily_rollups",
+    "get_keeper_rollups",
+    "get_animal_rollups",
+})
+
+# Bounds on cached results; entries of an older write generation are also dropped once it is superseded
+CACHE_ENTRIES = 200
+CACHE_TTL_SECONDS = 600
+
+_generation_lock = threading.Lock()
+_cached_generation = None
+
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_read(method, generation, args, kwargs):
+    """Run a DataManager read (generation only makes the result stale once data changes)"""
+    return getattr(_data_manager, method)(*args, **dict(kwargs))
+
+class CachedDataManager:
+    """DataManager facade whose reads are shared by all sessions and reruns until the next write.
+
+    Results are keyed on the write generation, which every save and delete bumps,
+    so a change made anywhere (including job workers) is visible on the next rerun.
+    """
+
+    def __init__(self, manager):
+        self._manager = manager
+
+    def _current_generation(self):
+        """The write generation, dropping every cached result as soon as it changes"""
+        global _cached_generation
+        generation = self._manager.get_write_generation()
+        with _generation_lock:
+            if generation != _cached_generation:
+                # Entries of the previous generation are never hit again
+                _cached_read.clear()
+                _cached_generation = generation
+        return generation
+
+    def __getattr__(self, name):
+        attr = getattr(self._manager, name)
+        if name not in CACHED_READS:
+            return attr
+
+        def cached_read(*args, **kwargs):
+            # Generators (e.g. the keys passed to get_comments_bulk) cannot be hashed
+            args = tuple(tuple(arg) if isinstance(arg, Iterator) else arg for arg in args)
+            return _cached_read(name, self._current_generation(), args, tuple(sorted(kwargs.items())))
+
+        return cached_read
+
+# Drop-in replacement for data_manager.data_manager in the interfaces
+data_manager = CachedDataManager(_data_manager)
@@ -1,6 +1,8 @@
 import streamlit as st
 from datetime import datetime, date, timedelta
-from data_manager import data_manager
+from components.data_cache import data_manager
+from components.pagination import get_observation_page, show_page_controls, observation_summary, select_observation
+from components.report_export import show_bulk_export
 
 def show_doctor_interface():
     """Display doctor interface for reviewing observations and adding comments"""
@@ -43,147 +45,165 @@ def show_observation_review():
         # Filter button
         filter_observations = st.button("🔍 Filter Observations", use_container_width=True)
     
-    # Get observations
-    if filter_observations or "doctor_observations" not in st.session_state:
-        observations = data_manager.get_observations_by_date_range(
-            start_date.strftime("%Y-%m-%d"),
-            end_date.strftime("%Y-%m-%d")
-        )
-        st.session_state.doctor_observations = observations
-    else:
-        observations = st.session_state.get("doctor_observations", [])
+    # Apply the date range when the filter button is pressed
+    if filter_observations or "doctor_review_filters" not in st.session_state:
+        st.session_state.doctor_review_filters = {
+            "start_date": start_date.strftime("%Y-%m-%d"),
+            "end_date": end_date.strftime("%Y-%m-%d")
+        }
+    
+    # Every medical report in the filtered range as one archive
+    show_bulk_export(
+        "doctor_export",
+        st.session_state.doctor_review_filters,
+        lambda obs, comments: generate_medical_report(obs, obs.get("structured_data", {}), comments),
+        "medical_reports"
+    )
+    
+    # Get the current page of observations
+    observations = get_observation_page("doctor_review_pager", st.session_state.doctor_review_filters)
     
     if not observations:
         st.info("🔍 No observations found for the selected date range.")
         return
     
-    st.success(f"📊 Found {len(observations)} observations")
+    st.success(f"📊 Showing {len(observations)} observations")
+    
+    # Summary rows only; the full record and its comments are loaded for the selected row
+    selected = select_observation("doctor_review_pager", observations)
+    show_page_controls("doctor_review_pager")
+    
+    if selected:
+        show_review_details(*selected)
+
+def show_review_details(obs_date, keeper_name):
+    """Show one observation in full with the doctor's assessment tools"""
+    obs = data_manager.get_observation(obs_date, keeper_name)
+    if obs is None:
+        st.info("🔍 This observation no longer exists.")
+        return
+    
+    raw_obs = obs.get("raw_observation", "")
+    structured_data = obs.get("structured_data", {})
+    comments = data_manager.get_comments(obs_date, keeper_name)
     
-    # Display observations
-    for idx, obs in enumerate(observations):
-        obs_date = obs.get("date", "Unknown")
-        keeper_name = obs.get("username", "Unknown")
-        obs_time = obs.get("timestamp", "")
-        raw_obs = obs.get("raw_observation", "")
-        structured_data = obs.get("structured_data", {})
+    with st.container(border=True):
+        st.markdown(f"**{observation_summary(obs, len(comments))}**")
         
-        with st.expander(f"📅 {obs_date} - Zoo Keeper: {keeper_name} ({datetime.fromisoformat(obs_time).strftime('%H:%M') if obs_time else ''})"):
-            
-            # Display observation content
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                st.markdown("**Raw Observation:**")
-                st.text_area("", value=raw_obs, height=120, disabled=True, key=f"doctor_raw_{idx}")
-                
-                # Key structured data highlights
-                if structured_data:
-                    st.markdown("**Key Health Indicators:**")
-                    
-                    # Health status indicators
-                    health_indicators = {
-                        "Animal Observed On Time": structured_data.get("animal_observed_on_time", "Unknown"),
-                        "Normal Behavior": structured_data.get("normal_behaviour_status", "Unknown"),
-                        "Clean Water Provided": structured_data.get("clean_drinking_water_provided", "Unknown"),
-                        "Feed Given as Prescribed": structured_data.get("feed_given_as_prescribed", "Unknown"),
-                        "Enclosure Cleaned": structured_data.get("enclosure_cleaned_properly", "Unknown")
-                    }
-                    
-                    cols = st.columns(len(health_indicators))
-                    for i, (indicator, value) in enumerate(health_indicators.items()):
-                        with cols[i]:
-                            if value is True:
-                                st.success(f"✅ {indicator}")
-                            elif value is False:
-                                st.error(f"❌ {indicator}")
-                            else:
-                                st.warning(f"⚠️ {indicator}: {value}")
-                    
-                    # Show abnormal behavior details if any
-                    abnormal_details = structured_data.get("normal_behaviour_details")
-                    if abnormal_details and abnormal_details.strip():
-                        st.warning(f"**Abnormal Behavior Noted:** {abnormal_details}")
-                    
-                    # Show other requirements
-                    other_req = structured_data.get("other_animal_requirements")
-                    if other_req and other_req.strip():
-                        st.info(f"**Special Requirements:** {other_req}")
+        # Display observation content
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.markdown("**Raw Observation:**")
+            st.text_area("", value=raw_obs, height=120, disabled=True, key=f"doctor_raw_{obs_date}_{keeper_name}")
             
-            with col2:
-                st.markdown("**Medical Assessment:**")
-                
-                # Doctor's comment section
-                comment_key = f"doctor_comment_{obs_date}_{keeper_name}"
-                doctor_comment = st.text_area(
-                    "Medical Notes/Comments:",
-                    key=comment_key,
-                    height=100,
-                    placeholder="Enter medical assessment, recommendations, or concerns..."
-                )
+            # Key structured data highlights
+            if structured_data:
+                st.markdown("**Key Health Indicators:**")
                 
-                # Priority/Urgency selector
-                priority = st.selectbox(
-                    "Priority Level:",
-                    ["Normal", "Monitor", "Urgent", "Critical"],
-                    key=f"priority_{obs_date}_{keeper_name}"
-                )
+                # Health status indicators
+                health_indicators = {
+                    "Animal Observed On Time": structured_data.get("animal_observed_on_time", "Unknown"),
+                    "Normal Behavior": structured_data.get("normal_behaviour_status", "Unknown"),
+                    "Clean Water Provided": structured_data.get("clean_drinking_water_provided", "Unknown"),
+                    "Feed Given as Prescribed": structured_data.get("feed_given_as_prescribed", "Unknown"),
+                    "Enclosure Cleaned": structured_data.get("enclosure_cleaned_properly", "Unknown")
+                }
                 
-                # Add comment button
-                if st.button(f"💬 Add Medical Comment", key=f"add_comment_{obs_date}_{keeper_name}"):
-                    if doctor_comment.strip():
-                        comment_text = f"[Priority: {priority}] {doctor_comment}"
-                        success = data_manager.save_comment(
-                            obs_date,
-                            keeper_name,
-                            st.session_state.username,
-                            comment_text,
-                            "doctor"
-                        )
-                        
-                        if success:
-                            st.success("✅ Medical comment added!")
-                            st.rerun()
+                cols = st.columns(len(health_indicators))
+                for i, (indicator, value) in enumerate(health_indicators.items()):
+                    with cols[i]:
+                        if value is True:
+                            st.success(f"✅ {indicator}")
+                        elif value is False:
+                            st.error(f"❌ {indicator}")
                         else:
-                            st.error("❌ Error adding comment!")
-                    else:
-                        st.warning("⚠️ Please enter a comment!")
+                            st.warning(f"⚠️ {indicator}: {value}")
                 
-                # Download report
-                if st.button(f"📄 Download Report", key=f"download_{obs_date}_{keeper_name}"):
-                    # Generate downloadable report
-                    report_content = generate_medical_report(obs, structured_data)
-                    st.download_button(
-                        label="📥 Download Medical Report",
-                        data=report_content,
-                        file_name=f"medical_report_{obs_date}_{keeper_name}.txt",
-                        mime="text/plain",
-                        key=f"dl_{obs_date}_{keeper_name}"
-                    )
+                # Show abnormal behavior details if any
+                abnormal_details = structured_data.get("normal_behaviour_details")
+                if abnormal_details and abnormal_details.strip():
+                    st.warning(f"**Abnormal Behavior Noted:** {abnormal_details}")
+                
+                # Show other requirements
+                other_req = structured_data.get("other_animal_requirements")
+                if other_req and other_req.strip():
+                    st.info(f"**Special Requirements:** {other_req}")
+        
+        with col2:
+            st.markdown("**Medical Assessment:**")
             
-            # Show existing comments
-            comments = data_manager.get_comments(obs_date, keeper_name)
-            if comments:
-                st.markdown("**Previous Comments:**")
-                for comment in comments:
-                    author = comment.get("comment_author", "Unknown")
-                    role = comment.get("author_role", "").title()
-                    text = comment.get("comment_text", "")
-                    timestamp = comment.get("timestamp", "")
+            # Doctor's comment section
+            comment_key = f"doctor_comment_{obs_date}_{keeper_name}"
+            doctor_comment = st.text_area(
+                "Medical Notes/Comments:",
+                key=comment_key,
+                height=100,
+                placeholder="Enter medical assessment, recommendations, or concerns..."
+            )
+            
+            # Priority/Urgency selector
+            priority = st.selectbox(
+                "Priority Level:",
+                ["Normal", "Monitor", "Urgent", "Critical"],
+                key=f"priority_{obs_date}_{keeper_name}"
+            )
+            
+            # Add comment button
+            if st.button(f"💬 Add Medical Comment", key=f"add_comment_{obs_date}_{keeper_name}"):
+                if doctor_comment.strip():
+                    comment_text = f"[Priority: {priority}] {doctor_comment}"
+                    success = data_manager.save_comment(
+                        obs_date,
+                        keeper_name,
+                        st.session_state.username,
+                        comment_text,
+                        "doctor"
+                    )
                     
-                    # Style based on role
-                    if role.lower() == "doctor":
-                        st.info(f"**Dr. {author}** - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
+                    if success:
+                        st.success("✅ Medical comment added!")
+                        st.rerun()
                     else:
-                        st.markdown(f"**{author}** ({role}) - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
+                        st.error("❌ Error adding comment!")
+                else:
+                    st.warning("⚠️ Please enter a comment!")
+            
+            # Download report
+            if st.button(f"📄 Download Report", key=f"download_{obs_date}_{keeper_name}"):
+                # Generate downloadable report
+                report_content = generate_medical_report(obs, structured_data, comments)
+                st.download_button(
+                    label="📥 Download Medical Report",
+                    data=report_content,
+                    file_name=f"medical_report_{obs_date}_{keeper_name}.txt",
+                    mime="text/plain",
+                    key=f"dl_{obs_date}_{keeper_name}"
+                )
+        
+        # Show existing comments
+        if comments:
+            st.markdown("**Previous Comments:**")
+            for comment in comments:
+                author = comment.get("comment_author", "Unknown")
+                role = comment.get("author_role", "").title()
+                text = comment.get("comment_text", "")
+                timestamp = comment.get("timestamp", "")
+                
+                # Style based on role
+                if role.lower() == "doctor":
+                    st.info(f"**Dr. {author}** - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
+                else:
+                    st.markdown(f"**{author}** ({role}) - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}\n\n{text}")
 
 def show_analytics():
     """Show analytics dashboard for doctors"""
     st.header("📊 Medical Analytics Dashboard")
     
-    # Get all observations for analysis
-    all_observations = data_manager.get_all_observations()
+    # Precomputed counters; cost does not grow with history
+    totals = data_manager.get_rollup_totals()
     
-    if not all_observations:
+    if not totals["observations"]:
         st.info("📊 No data available for analysis.")
         return
     
@@ -191,58 +211,40 @@ def show_analytics():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Observations", len(all_observations))
+        st.metric("Total Observations", totals["observations"])
     
     with col2:
         # Count observations from last 7 days
-        recent_obs = [obs for obs in all_observations 
-                     if obs.get("date", "") >= (date.today() - timedelta(days=7)).strftime("%Y-%m-%d")]
-        st.metric("Last 7 Days", len(recent_obs))
+        week_start = (date.today() - timedelta(days=7)).strftime("%Y-%m-%d")
+        recent_days = data_manager.get_daily_rollups(week_start)
+        st.metric("Last 7 Days", sum(day["observations"] for day in recent_days.values()))
     
     with col3:
         # Count unique zoo keepers
-        unique_keepers = len(set(obs.get("username", "") for obs in all_observations))
-        st.metric("Active Keepers", unique_keepers)
+        st.metric("Active Keepers", totals["keepers"])
     
     with col4:
         # Count observations with abnormal behavior
-        abnormal_count = 0
-        for obs in all_observations:
-            structured = obs.get("structured_data", {})
-            if not structured.get("normal_behaviour_status", True):
-                abnormal_count += 1
-        st.metric("Abnormal Behaviors", abnormal_count, delta=None)
+        st.metric("Abnormal Behaviors", totals["abnormal"], delta=None)
     
     st.markdown("---")
     
     # Health trends
     st.subheader("🏥 Health Trend Analysis")
     
-    # Analyze key health indicators
+    # Key health indicators -> rollup counter
     health_metrics = {
-        "Animals Observed On Time": [],
-        "Normal Behavior": [],
-        "Clean Water Available": [],
-        "Proper Feeding": [],
-        "Clean Enclosures": []
+        "Animals Observed On Time": "on_time",
+        "Normal Behavior": "normal_behaviour",
+        "Clean Water Available": "clean_water",
+        "Proper Feeding": "proper_feeding",
+        "Clean Enclosures": "clean_enclosure"
     }
     
-    dates = []
-    for obs in sorted(all_observations, key=lambda x: x.get("date", "")):
-        structured = obs.get("structured_data", {})
-        dates.append(obs.get("date", ""))
-        
-        health_metrics["Animals Observed On Time"].append(structured.get("animal_observed_on_time", False))
-        health_metrics["Normal Behavior"].append(structured.get("normal_behaviour_status", False))
-        health_metrics["Clean Water Available"].append(structured.get("clean_drinking_water_provided", False))
-        health_metrics["Proper Feeding"].append(structured.get("feed_given_as_prescribed", False))
-        health_metrics["Clean Enclosures"].append(structured.get("enclosure_cleaned_properly", False))
-    
     # Display trends
-    for metric, values in health_metrics.items():
-        if values:
-            percentage = (sum(values) / len(values)) * 100
-            st.progress(percentage / 100, text=f"{metric}: {percentage:.1f}% compliance")
+    for metric, counter in health_metrics.items():
+        percentage = (totals[counter] / totals["observations"]) * 100
+        st.progress(percentage / 100, text=f"{metric}: {percentage:.1f}% compliance")
 
 def show_search_interface():
     """Show search interface for doctors"""
@@ -253,7 +255,7 @@ def show_search_interface():
     
     with col1:
         search_text = st.text_input("🔍 Search in observations:", placeholder="Enter keywords...")
-        search_keeper = st.selectbox("👤 Filter by Zoo Keeper:", ["All"] + list(set(obs.get("username", "") for obs in data_manager.get_all_observations())))
+        search_keeper = st.selectbox("👤 Filter by Zoo Keeper:", ["All"] + data_manager.get_keepers())
     
     with col2:
         search_priority = st.multiselect("⚠️ Filter by Priority:", ["Normal", "Monitor", "Urgent", "Critical"])
@@ -274,21 +276,23 @@ def show_search_interface():
                     st.text_area("Observation:", value=raw_obs, height=100, disabled=True, key=f"search_obs_{obs_date}_{keeper_name}")
                     
                     # Show why this matched
-                    if search_text and search_text.lower() in raw_obs.lower():
-                        st.info(f"🎯 Matched search term: '{search_text}'")
+                    if search_text.strip():
+                        st.info(f"🎯 Matched all search terms: '{search_text}'")
         else:
             st.info("🔍 No observations match your search criteria.")
 
 def search_observations(search_text, keeper_filter, priority_filter, abnormal_only):
     """Search observations based on criteria"""
-    all_observations = data_manager.get_all_observations()
-    results = []
+    # Text search goes through the full-text index (ranked, best match first)
+    if search_text.strip():
+        all_observations = data_manager.search_observations(search_text)
+    elif keeper_filter != "All":
+        all_observations = data_manager.get_observations_by_user(keeper_filter)
+    else:
+        all_observations = data_manager.get_all_observations()
+    candidates = []
     
     for obs in all_observations:
-        # Text search
-        if search_text and search_text.lower() not in obs.get("raw_observation", "").lower():
-            continue
-        
         # Keeper filter
         if keeper_filter != "All" and obs.get("username", "") != keeper_filter:
             continue
@@ -299,25 +303,35 @@ def search_observations(search_text, keeper_filter, priority_filter, abnormal_on
             if structured.get("normal_behaviour_status", True):
                 continue
         
-        # Priority filter (check comments)
-        if priority_filter:
-            comments = data_manager.get_comments(obs.get("date", ""), obs.get("username", ""))
-            comment_priorities = []
-            for comment in comments:
-                comment_text = comment.get("comment_text", "")
-                for priority in priority_filter:
-                    if f"[Priority: {priority}]" in comment_text:
-                        comment_priorities.append(priority)
-            
-            if not any(p in comment_priorities for p in priority_filter):
-                continue
+        candidates.append(obs)
+    
+    if not priority_filter:
+        return candidates
+    
+    # Priority filter (check comments of the remaining candidates in one pass)
+    comments_by_obs = data_manager.get_comments_bulk(
+        (obs.get("date", ""), obs.get("username", "")) for obs in candidates
+    )
+    results = []
+    
+    for obs in candidates:
+        comments = comments_by_obs.get((obs.get("date", ""), obs.get("username", "")), [])
+        comment_priorities = []
+        for comment in comments:
+            comment_text = comment.get("comment_text", "")
+            for priority in priority_filter:
+                if f"[Priority: {priority}]" in comment_text:
+                    comment_priorities.append(priority)
+        
+        if not any(p in comment_priorities for p in priority_filter):
+            continue
         
         results.append(obs)
     
     return results
 
-def generate_medical_report(obs, structured_data):
-    """Generate medical report content"""
+def generate_medical_report(obs, structured_data, comments=None):
+    """Generate medical report content (comments are fetched if not supplied)"""
     report = f"""MEDICAL OBSERVATION REPORT
 ========================
 
@@ -358,7 +372,8 @@ MEDICAL COMMENTS:
 """
     
     # Add comments
-    comments = data_manager.get_comments(obs.get('date', ''), obs.get('username', ''))
+    if comments is None:
+        comments = data_manager.get_comments(obs.get('date', ''), obs.get('username', ''))
     for comment in comments:
         if comment.get('author_role') == 'doctor':
             author = comment.get('comment_author', 'Unknown')
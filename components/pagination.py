@@ -0,0 +1,149 @@
+import os
+import streamlit as st
+from datetime import datetime
+from components.data_cache import data_manager
+
+# Observations shown per page in list views; each view lets the user pick another size
+PAGE_SIZE = int(os.getenv("ZOO_PAGE_SIZE", "20"))
+PAGE_SIZE_OPTIONS = sorted({10, 20, 50, 100, PAGE_SIZE})
+
+# Checklist fields shown as one icon each in summary rows
+SUMMARY_FIELDS = (
+    "animal_observed_on_time",
+    "normal_behaviour_status",
+    "clean_drinking_water_provided",
+    "feed_given_as_prescribed",
+    "enclosure_cleaned_properly",
+)
+
+def get_observation_page(state_key, filters):
+    """Fetch the current page of observations for a list view.
+
+    The cursor trail lives in session state under state_key and restarts at the
+    first page whenever the filters or the page size change.
+    """
+    page_size = st.session_state.get(f"{state_key}_size", PAGE_SIZE)
+    pager = st.session_state.get(state_key)
+    if pager is None or pager["filters"] != filters or pager.get("page_size") != page_size:
+        pager = {"filters": filters, "cursors": [None], "page": 0, "page_size": page_size}
+        st.session_state[state_key] = pager
+
+    observations, next_cursor = data_manager.iter_observations(
+        filters,
+        limit=page_size,
+        cursor=pager["cursors"][pager["page"]]
+    )
+
+    # Remember where the next page starts (drops any stale trail past this page)
+    del pager["cursors"][pager["page"] + 1:]
+    if next_cursor:
+        pager["cursors"].append(next_cursor)
+
+    return observations
+
+def _change_page(state_key, delta):
+    """Move the pager stored under state_key by delta pages"""
+    pager = st.session_state[state_key]
+    pager["page"] = max(0, min(pager["page"] + delta, len(pager["cursors"]) - 1))
+
+def show_page_controls(state_key):
+    """Show previous/next buttons and the page size picker for the pager stored under state_key"""
+    pager = st.session_state[state_key]
+    has_next = len(pager["cursors"]) > pager["page"] + 1
+
+    col1, col2, col3, col4 = st.columns([1, 2, 1, 1])
+
+    if pager["page"] > 0 or has_next:
+        with col1:
+            st.button("⬅️ Previous", key=f"{state_key}_prev", disabled=pager["page"] == 0,
+                      on_click=_change_page, args=(state_key, -1), use_container_width=True)
+
+        with col2:
+            st.markdown(f"<p style='text-align: center'>Page {pager['page'] + 1}</p>", unsafe_allow_html=True)
+
+        with col3:
+            st.button("Next ➡️", key=f"{state_key}_next", disabled=not has_next,
+                      on_click=_change_page, args=(state_key, 1), use_container_width=True)
+
+    with col4:
+        st.selectbox(
+            "Per page",
+            PAGE_SIZE_OPTIONS,
+            index=PAGE_SIZE_OPTIONS.index(PAGE_SIZE),
+            key=f"{state_key}_size",
+            format_func=lambda size: f"{size} per page",
+            label_visibility="collapsed"
+        )
+
+def checklist_icons(structured_data):
+    """One icon per summary checklist field: ✅ yes, ❌ no, ⚪ unknown"""
+    return "".join(
+        "✅" if structured_data.get(field) is True else "❌" if structured_data.get(field) is False else "⚪"
+        for field in SUMMARY_FIELDS
+    )
+
+def observation_summary(obs, comment_count=0, show_keeper=True):
+    """One-line label for an observation: date, keeper, time, animal, checklist icons and comment count"""
+    parts = [f"📅 {obs.get('date', 'Unknown')}"]
+    if show_keeper:
+        parts.append(obs.get("username", "Unknown"))
+    if obs.get("timestamp"):
+        parts.append(datetime.fromisoformat(obs["timestamp"]).strftime("%H:%M"))
+
+    structured_data = obs.get("structured_data") or {}
+    if structured_data:
+        if structured_data.get("animal_name"):
+            parts.append(f"🐾 {structured_data['animal_name']}")
+        parts.append(checklist_icons(structured_data))
+    else:
+        parts.append("⏳ processing")
+
+    if comment_count:
+        parts.append(f"💬 {comment_count}")
+    return " · ".join(parts)
+
+def select_observation(state_key, observations):
+    """Show a page of observations as one summary row each and return the selected (date, username), or None.
+
+    Only header fields are sent to the browser; callers load the full observation
+    and its comments for the selected row alone. The selection is kept in session
+    state because Streamlit resets a table's selection whenever its rows change
+    (e.g. when a queued observation finishes processing).
+    """
+    rows = []
+    for obs in observations:
+        structured_data = obs.get("structured_data") or {}
+        rows.append({
+            "Date": obs.get("date", ""),
+            "Keeper": obs.get("username", ""),
+            "Time": datetime.fromisoformat(obs["timestamp"]).strftime("%H:%M") if obs.get("timestamp") else "",
+            "Animal": structured_data.get("animal_name", ""),
+            "Checklist": checklist_icons(structured_data) if structured_data else "⏳ processing",
+        })
+
+    event = st.dataframe(
+        rows,
+        key=f"{state_key}_table",
+        on_select="rerun",
+        selection_mode="single-row",
+        hide_index=True,
+        use_container_width=True
+    )
+
+    # The stored selection remembers the rows it was made in: only that same table
+    # coming back empty means the user cleared it; any other table is a fresh widget
+    selected_key = f"{state_key}_selected"
+    selected = event["selection"]["rows"]
+    stored = st.session_state.get(selected_key)
+    if selected and selected[0] < len(observations):
+        obs = observations[selected[0]]
+        stored = {"key": (obs.get("date", ""), obs.get("username", "")), "rows": rows}
+        st.session_state[selected_key] = stored
+    elif stored and stored["rows"] == rows:
+        st.session_state.pop(selected_key)
+        stored = None
+
+    if stored is None or stored["key"] not in {(obs.get("date", ""), obs.get("username", "")) for obs in observations}:
+        st.caption("👆 Select a row to open the observation")
+        return None
+    return stored["key"]
@@ -0,0 +1,148 @@
+import io
+import csv
+import zipfile
+import tempfile
+import streamlit as st
+from datetime import datetime
+from data_manager import data_manager as storage
+from components.data_cache import data_manager
+
+# Observations fetched (with their comment threads) per step of an export
+EXPORT_BATCH_SIZE = 200
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable buffer that zipfile streams into; drained after every entry"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        """Return and forget everything written so far"""
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+def iter_export_observations(filters):
+    """Yield (observation, comments) for every observation matching filters, oldest first, one batch at a time"""
+    # Read storage directly: one-off export pages would only crowd out the shared read cache
+    cursor = None
+    while True:
+        observations, cursor = storage.iter_observations(
+            filters, order="asc", limit=EXPORT_BATCH_SIZE, cursor=cursor
+        )
+        comments_by_obs = storage.get_comments_bulk(
+            (obs.get("date", ""), obs.get("username", "")) for obs in observations
+        )
+        for obs in observations:
+            yield obs, comments_by_obs.get((obs.get("date", ""), obs.get("username", "")), [])
+        if cursor is None:
+            return
+
+def format_comments(comments):
+    """Plain-text comment thread, oldest first"""
+    lines = []
+    for comment in comments:
+        timestamp = comment.get("timestamp", "")
+        if timestamp:
+            timestamp = datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
+        lines.append(f"{comment.get('comment_author', 'Unknown')} ({comment.get('author_role', '').title()}) - {timestamp}")
+        lines.append(comment.get("comment_text", ""))
+        lines.append("")
+    return "\n".join(lines)
+
+def stream_reports_zip(records, render_report):
+    """Yield a ZIP archive in chunks: one folder per observation with its report and comments, plus index.csv.
+
+    records is an iterable of (observation, comments); each entry is compressed
+    and flushed before the next observation is read, so memory use does not
+    grow with the number of observations.
+    """
+    sink = _ChunkSink()
+    index = io.StringIO()
+    index_writer = csv.writer(index)
+    index_writer.writerow(["date", "keeper", "animal", "normal_behaviour", "comments", "folder"])
+
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for obs, comments in records:
+            obs_date, keeper_name = obs.get("date", ""), obs.get("username", "")
+            folder = f"{obs_date}_{keeper_name}"
+
+            archive.writestr(f"{folder}/report.txt", render_report(obs, comments))
+            if comments:
+                archive.writestr(f"{folder}/comments.txt", format_comments(comments))
+
+            structured_data = obs.get("structured_data") or {}
+            index_writer.writerow([
+                obs_date, keeper_name, structured_data.get("animal_name", ""),
+                structured_data.get("normal_behaviour_status", ""), len(comments), folder
+            ])
+            yield sink.drain()
+
+        archive.writestr("index.csv", index.getvalue())
+    yield sink.drain()
+
+def spool_to_file(chunks):
+    """Write chunks to an anonymous temporary file and return it, rewound, for st.download_button.
+
+    The file is unbuffered (a raw file object, which download_button accepts
+    as is), so the export is never held in memory by the caller; close it once
+    the button has been rendered.
+    """
+    output = tempfile.TemporaryFile(buffering=0)
+    try:
+        for chunk in chunks:
+            output.write(chunk)
+        output.seek(0)
+    except BaseException:
+        output.close()
+        raise
+    return output
+
+def build_reports_zip(filters, render_report):
+    """Build the ZIP export for the filters; returns (archive file, observation count)"""
+    count = 0
+
+    def counted():
+        nonlocal count
+        for record in iter_export_observations(filters):
+            count += 1
+            yield record
+
+    return spool_to_file(stream_reports_zip(counted(), render_report)), count
+
+def show_bulk_export(state_key, filters, render_report, file_prefix):
+    """Show animal filter and ZIP export controls for every observation matching filters"""
+    with st.expander("📦 Bulk Report Export (ZIP)"):
+        animals = [row["animal_name"] for row in data_manager.get_animal_rollups() if row.get("animal_name")]
+        animal = st.selectbox("Animal", ["All"] + animals, key=f"{state_key}_animal")
+
+        export_filters = {key: value for key, value in filters.items() if value}
+        if animal != "All":
+            export_filters["animal_name"] = animal
+
+        if st.button("📦 Build ZIP Export", key=f"{state_key}_build", use_container_width=True):
+            with st.spinner("Building report archive..."):
+                archive, count = build_reports_zip(export_filters, render_report)
+
+            with archive:
+                if not count:
+                    st.info("🔍 No observations match this export.")
+                    return
+
+                st.success(f"✅ {count} reports ready")
+                st.download_button(
+                    label="📥 Download ZIP",
+                    data=archive,
+                    file_name=f"{file_prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+                    mime="application/zip",
+                    on_click="ignore",
+                    key=f"{state_key}_download",
+                    use_container_width=True
+                )
@@ -1,7 +1,8 @@
 import streamlit as st
 from datetime import datetime, date
-from zoo_model import zoo_model
-from data_manager import data_manager
+from components.data_cache import data_manager
+from job_queue import get_job_queue, PENDING_TRANSCRIPT, QUEUED, DONE, FAILED, SUPERSEDED, FINISHED_STATES
+from components.pagination import get_observation_page, show_page_controls, observation_summary
 
 # Audio input is now natively available in Streamlit
 AUDIO_AVAILABLE = True
@@ -131,153 +132,196 @@ Example: "Morning rounds at 8 AM. Lions were active and alert. Fed at scheduled
                     st.rerun()
         
         if process_button and can_process:
-            with st.spinner("🔄 Processing observation with AI model..."):
-                try:
-                    # Use edit date if in edit mode, otherwise use selected date
-                    obs_date = edit_date if edit_mode else selected_date.strftime("%Y-%m-%d")
-                    
-                    # Process based on input method
-                    if input_method == "📝 Text Input":
-                        # Process text observation
-                        structured_data = zoo_model.process_observation(observation_text, obs_date)
-                        final_observation_text = observation_text
-                    else:
-                        # Process audio observation (transcribe + structure)
-                        try:
-                            # Read audio bytes from st.audio_input
-                            if audio_data is not None:
-                                audio_bytes = audio_data.read()
-                                
-                                structured_data = zoo_model.process_audio_observation(audio_bytes, obs_date, language="hi")
-                                
-                                # Get the transcribed text for storage
-                                final_observation_text = zoo_model.transcribe_audio(audio_bytes, language="hi")
-                            else:
-                                final_observation_text = "No audio data"
-                                structured_data = zoo_model._create_fallback_data(final_observation_text, obs_date)
-                        except Exception as e:
-                            st.error(f"Audio processing error: {e}")
-                            final_observation_text = "Audio processing failed"
-                            structured_data = zoo_model._create_fallback_data(final_observation_text, obs_date)
-                    
-                    # Convert to dictionary for storage
-                    if hasattr(structured_data, 'dict'):
-                        structured_dict = structured_data.dict()
-                    else:
-                        structured_dict = dict(structured_data)
-                    
-                    # Save to file system
-                    file_path = data_manager.save_observation(
-                        obs_date,
-                        st.session_state.username,
-                        final_observation_text,
-                        structured_dict
-                    )
-                    
-                    # Success message
-                    st.success("✅ Observation processed and saved successfully!")
-                    
-                    # Show transcribed text if it was audio input
-                    if input_method == "🎤 Hindi Voice Input":
-                        with st.expander("🔤 Transcribed Text"):
-                            st.text_area("Hindi → English Transcription:", value=final_observation_text, height=100, disabled=True)
-                    
-                    # Show auto-filled form with structured data
-                    st.markdown("---")
-                    st.subheader("📋 Auto-Filled Observation Form")
-                    st.info("✨ The AI has automatically filled out the following form based on your observation:")
-                    
-                    with st.form(key="observation_form_display"):
-                        st.markdown("### 🐾 Animal Information")
-                        col_a1, col_a2 = st.columns(2)
-                        with col_a1:
-                            st.text_input("Name of the animal", value=structured_dict.get("animal_name", ""), disabled=True)
-                        with col_a2:
-                            st.text_input("Date or day of observation", value=structured_dict.get("date_or_day", ""), disabled=True)
-                        
-                        st.markdown("### ✅ Daily Check Items")
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.checkbox("Was the animal seen at the scheduled observation time?", 
-                                       value=structured_dict.get("animal_observed_on_time", False), disabled=True)
-                            st.checkbox("Was clean drinking water available?", 
-                                       value=structured_dict.get("clean_drinking_water_provided", False), disabled=True)
-                            st.checkbox("Was the enclosure cleaned as required?", 
-                                       value=structured_dict.get("enclosure_cleaned_properly", False), disabled=True)
-                        with col2:
-                            st.checkbox("Is the animal showing normal behaviour and activity?", 
-                                       value=structured_dict.get("normal_behaviour_status", False), disabled=True)
-                            st.checkbox("Was feed and supplements available?", 
-                                       value=structured_dict.get("feed_and_supplements_available", False), disabled=True)
-                            st.checkbox("Was the feed given as prescribed?", 
-                                       value=structured_dict.get("feed_given_as_prescribed", False), disabled=True)
-                        
-                        st.markdown("### 📝 Additional Details")
-                        abnormal_details = structured_dict.get("normal_behaviour_details", "") or "No abnormal behaviour observed"
-                        st.text_area("If abnormal behaviour observed, provide details", 
-                                    value=abnormal_details, height=80, disabled=True)
-                        
-                        other_requirements = structured_dict.get("other_animal_requirements", "") or "No special requirements"
-                        st.text_area("Any other special needs or requirements", 
-                                    value=other_requirements, height=80, disabled=True)
-                        
-                        st.text_input("Signature of caretaker or in-charge", 
-                                     value=structured_dict.get("incharge_signature", ""), disabled=True)
-                        
-                        st.markdown("### 📊 Summary Reports")
-                        st.text_area("Summary of daily animal health monitoring", 
-                                    value=structured_dict.get("daily_animal_health_monitoring", ""), 
-                                    height=100, disabled=True)
-                        
-                        st.text_area("Summary of carnivorous animal feeding chart", 
-                                    value=structured_dict.get("carnivorous_animal_feeding_chart", ""), 
-                                    height=100, disabled=True)
-                        
-                        st.text_area("Summary of medicine stock register", 
-                                    value=structured_dict.get("medicine_stock_register", ""), 
-                                    height=100, disabled=True)
-                        
-                        st.text_area("Summary of daily wildlife monitoring observations", 
-                                    value=structured_dict.get("daily_wildlife_monitoring", ""), 
-                                    height=100, disabled=True)
-                        
-                        st.form_submit_button("📄 Form Complete (View Only)", disabled=True)
-                    
-                    st.info(f"📁 Saved to: {file_path}")
-                    
-                    # Reset edit mode
-                    if edit_mode:
-                        st.session_state.edit_mode = False
-                        st.session_state.edit_date = None
-                        st.session_state.edit_observation = ""
+            try:
+                # Use edit date if in edit mode, otherwise use selected date
+                obs_date = edit_date if edit_mode else selected_date.strftime("%Y-%m-%d")
+                job_queue = get_job_queue()
+                
+                # Save the raw observation right away; AI enrichment runs in the background.
+                # A re-saved observation keeps its previous structured data until the job replaces it.
+                previous = data_manager.get_observation(obs_date, st.session_state.username)
+                structured_data = (previous or {}).get("structured_data") or {}
+                if input_method == "📝 Text Input":
+                    file_path = data_manager.save_observation(obs_date, st.session_state.username, observation_text, structured_data)
+                    job_id = job_queue.submit_text(obs_date, st.session_state.username, observation_text)
+                else:
+                    audio_bytes = audio_data.read()
+                    file_path = data_manager.save_observation(obs_date, st.session_state.username, PENDING_TRANSCRIPT, structured_data)
+                    job_id = job_queue.submit_audio(obs_date, st.session_state.username, audio_bytes, language="hi")
+                
+                st.session_state.setdefault("observation_jobs", []).append(job_id)
+                
+                # Success message
+                st.success("✅ Observation saved! The AI is filling in the form in the background - you can carry on working.")
+                st.info(f"📁 Saved to: {file_path}")
+                
+                # Reset edit mode
+                if edit_mode:
+                    st.session_state.edit_mode = False
+                    st.session_state.edit_date = None
+                    st.session_state.edit_observation = ""
                     
-                    # Option to create another entry
-                    if st.button("➕ Create Another Entry", key="another_entry"):
-                        st.rerun()
-                        
-                except Exception as e:
-                    st.error(f"❌ Error processing observation: {str(e)}")
+            except Exception as e:
+                st.error(f"❌ Error saving observation: {str(e)}")
+        
+        show_observation_jobs()
+
+def show_observation_jobs():
+    """Show AI progress for this keeper's submissions and the filled-in forms once ready"""
+    job_queue = get_job_queue()
+    job_ids = st.session_state.setdefault("observation_jobs", [])
+    
+    # Also pick up jobs submitted before a page reload
+    for job in job_queue.get_active_jobs(st.session_state.username):
+        if job["id"] not in job_ids:
+            job_ids.append(job["id"])
+    
+    jobs = [job for job in (job_queue.get_job(job_id) for job_id in job_ids) if job]
+    
+    pending_ids = [job["id"] for job in jobs if job["status"] not in FINISHED_STATES]
+    if pending_ids:
+        show_pending_jobs(pending_ids)
+    
+    for job in jobs:
+        if job["status"] == DONE:
+            show_finished_job(job)
+        elif job["status"] == FAILED:
+            kept = "The recording is kept with the failed job." if job["kind"] == "audio" else "Your raw observation is saved."
+            st.error(f"❌ AI processing failed for {job['date']}: {job['error']}. {kept}")
+            st.button("Dismiss", key=f"dismiss_job_{job['id']}", on_click=_dismiss_job, args=(job["id"],))
+        elif job["status"] == SUPERSEDED:
+            _dismiss_job(job["id"])
+
+@st.fragment(run_every=3)
+def show_pending_jobs(job_ids):
+    """Poll background jobs; reruns the page once any of them has finished"""
+    job_queue = get_job_queue()
+    finished = False
+    
+    for job_id in job_ids:
+        job = job_queue.get_job(job_id)
+        if job is None or job["status"] in FINISHED_STATES:
+            finished = True
+        elif job["status"] == QUEUED:
+            st.info(f"⏳ Waiting for AI processing: observation for {job['date']}")
+        else:
+            st.info(f"🔄 AI is processing your observation for {job['date']}...")
+    
+    if finished:
+        st.rerun()
+
+def _dismiss_job(job_id):
+    """Stop showing a finished job"""
+    job_ids = st.session_state.get("observation_jobs", [])
+    if job_id in job_ids:
+        job_ids.remove(job_id)
+
+def show_finished_job(job):
+    """Show the AI-filled form of a completed job"""
+    result = job.get("result") or {}
+    structured_dict = result.get("structured_data", {})
+    
+    st.success(f"✅ AI processing complete for {job['date']}!")
+    
+    # Show transcribed text if it was audio input
+    if job["kind"] == "audio":
+        with st.expander("🔤 Transcribed Text"):
+            st.text_area("Hindi → English Transcription:", value=result.get("observation_text", ""),
+                         height=100, disabled=True, key=f"transcript_{job['id']}")
+    
+    # Show auto-filled form with structured data
+    st.markdown("---")
+    st.subheader("📋 Auto-Filled Observation Form")
+    st.info("✨ The AI has automatically filled out the following form based on your observation:")
+    show_structured_form(structured_dict, f"observation_form_display_{job['id']}")
+    
+    # Option to create another entry
+    st.button("➕ Create Another Entry", key=f"dismiss_job_{job['id']}", on_click=_dismiss_job, args=(job["id"],))
+
+def show_structured_form(structured_dict, form_key):
+    """Show structured observation data as a read-only form"""
+    with st.form(key=form_key):
+        st.markdown("### 🐾 Animal Information")
+        col_a1, col_a2 = st.columns(2)
+        with col_a1:
+            st.text_input("Name of the animal", value=structured_dict.get("animal_name", ""), disabled=True)
+        with col_a2:
+            st.text_input("Date or day of observation", value=structured_dict.get("date_or_day", ""), disabled=True)
+        
+        st.markdown("### ✅ Daily Check Items")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.checkbox("Was the animal seen at the scheduled observation time?", 
+                       value=structured_dict.get("animal_observed_on_time", False), disabled=True)
+            st.checkbox("Was clean drinking water available?", 
+                       value=structured_dict.get("clean_drinking_water_provided", False), disabled=True)
+            st.checkbox("Was the enclosure cleaned as required?", 
+                       value=structured_dict.get("enclosure_cleaned_properly", False), disabled=True)
+        with col2:
+            st.checkbox("Is the animal showing normal behaviour and activity?", 
+                       value=structured_dict.get("normal_behaviour_status", False), disabled=True)
+            st.checkbox("Was feed and supplements available?", 
+                       value=structured_dict.get("feed_and_supplements_available", False), disabled=True)
+            st.checkbox("Was the feed given as prescribed?", 
+                       value=structured_dict.get("feed_given_as_prescribed", False), disabled=True)
+        
+        st.markdown("### 📝 Additional Details")
+        abnormal_details = structured_dict.get("normal_behaviour_details", "") or "No abnormal behaviour observed"
+        st.text_area("If abnormal behaviour observed, provide details", 
+                    value=abnormal_details, height=80, disabled=True)
+        
+        other_requirements = structured_dict.get("other_animal_requirements", "") or "No special requirements"
+        st.text_area("Any other special needs or requirements", 
+                    value=other_requirements, height=80, disabled=True)
+        
+        st.text_input("Signature of caretaker or in-charge", 
+                     value=structured_dict.get("incharge_signature", ""), disabled=True)
+        
+        st.markdown("### 📊 Summary Reports")
+        st.text_area("Summary of daily animal health monitoring", 
+                    value=structured_dict.get("daily_animal_health_monitoring", ""), 
+                    height=100, disabled=True)
+        
+        st.text_area("Summary of carnivorous animal feeding chart", 
+                    value=structured_dict.get("carnivorous_animal_feeding_chart", ""), 
+                    height=100, disabled=True)
+        
+        st.text_area("Summary of medicine stock register", 
+                    value=structured_dict.get("medicine_stock_register", ""), 
+                    height=100, disabled=True)
+        
+        st.text_area("Summary of daily wildlife monitoring observations", 
+                    value=structured_dict.get("daily_wildlife_monitoring", ""), 
+                    height=100, disabled=True)
+        
+        st.form_submit_button("📄 Form Complete (View Only)", disabled=True)
 
 def show_my_observations():
     """Show zoo keeper's previous observations"""
     st.header("📋 My Previous Observations")
     
-    # Get all observations for current user
-    all_observations = data_manager.get_all_observations()
-    user_observations = [obs for obs in all_observations 
-                        if obs.get("username") == st.session_state.username]
+    # Get the current page of this keeper's observations
+    user_observations = get_observation_page(
+        "my_observations_pager",
+        {"username": st.session_state.username}
+    )
     
     if not user_observations:
         st.info("🔍 No observations found. Create your first observation in the 'New Observation' tab!")
         return
     
+    # Load every comment thread for the listed observations in one pass
+    comments_by_obs = data_manager.get_comments_bulk(
+        (obs.get("date", ""), st.session_state.username) for obs in user_observations
+    )
+    
     # Display observations
     for obs in user_observations:
         obs_date = obs.get("date", "Unknown")
-        obs_time = obs.get("timestamp", "")
         raw_obs = obs.get("raw_observation", "")
+        comments = comments_by_obs.get((obs_date, st.session_state.username), [])
         
-        with st.expander(f"📅 {obs_date} - {datetime.fromisoformat(obs_time).strftime('%H:%M') if obs_time else ''}"):
+        with st.expander(observation_summary(obs, len(comments), show_keeper=False)):
             col1, col2 = st.columns([3, 1])
             
             with col1:
@@ -292,6 +336,15 @@ def show_my_observations():
                     st.session_state.edit_observation = raw_obs
                     st.rerun()
                 
+                if st.button("📄 Report", key=f"report_{obs_date}"):
+                    st.download_button(
+                        label="📥 Download Report",
+                        data=data_manager.render_observation_report(obs),
+                        file_name=f"observation_{obs_date}_{st.session_state.username}.txt",
+                        mime="text/plain",
+                        key=f"dl_report_{obs_date}"
+                    )
+                
                 if st.button("🗑️ Delete", key=f"delete_{obs_date}"):
                     if data_manager.delete_observation(obs_date, st.session_state.username):
                         st.success("✅ Observation deleted successfully!")
@@ -306,7 +359,6 @@ def show_my_observations():
                 st.json(structured_data)
             
             # Show comments from doctors/admins
-            comments = data_manager.get_comments(obs_date, st.session_state.username)
             if comments:
                 st.markdown("**Comments from Staff:**")
                 for comment in comments:
@@ -318,3 +370,5 @@ def show_my_observations():
                     st.markdown(f"**{author}** ({role}) - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else ''}")
                     st.markdown(f"> {text}")
                     st.markdown("---")
+    
+    show_page_controls("my_observations_pager")
@@ -1,7 +1,16 @@
 import os
 import json
+import time
+import bisect
+import tempfile
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: comment appends are only locked within this process
+    fcntl = None
 
 class DataManager:
     def __init__(self):
@@ -9,89 +18,543 @@ class DataManager:
         self.observations_dir = "data/observations"
         self.comments_dir = "data/comments"
         
+        # Parsed observations keyed by filename -> (mtime_ns, size, data).
+        # Shared by every session using the global instance, so guard it.
+        self._observation_cache = {}
+        self._cache_lock = threading.RLock()
+        
+        # Sorted (date, username) keys parsed from "{date}_{username}.json"
+        # filenames, re-listed only when the directory mtime changes
+        self._observation_keys = []
+        self._observation_keys_mtime = None
+        
+        # Comment threads keyed by "{date}_{username}" ->
+        # (legacy_signature, log_inode, log_offset, comments). The JSONL log is
+        # append-only, so a grown log only needs its new tail parsed.
+        self._comment_cache = {}
+        self._comment_threads = frozenset()
+        self._comment_threads_mtime = None
+        self._comment_write_lock = threading.Lock()
+        
+        # Full-text index, opened (and caught up with storage) on first search
+        self.search_index_path = "data/search_index.db"
+        self._search_index = None
+        self._search_index_lock = threading.Lock()
+        
+        # Dashboard aggregates, opened (and caught up with storage) on first read
+        self.rollups_path = "data/rollups.db"
+        self._rollups = None
+        self._rollups_lock = threading.Lock()
+        
+        # Bumped by every write. The marker file carries it to other processes
+        # (job workers, reextract.py), so read caches know exactly when to drop.
+        self.generation_path = "data/write_generation"
+        self._write_generation = 0
+        
         # Ensure directories exist
         os.makedirs(self.observations_dir, exist_ok=True)
         os.makedirs(self.comments_dir, exist_ok=True)
     
-    def save_observation(self, date: str, username: str, raw_observation: str, structured_data: dict) -> str:
-        """Save observation data to file"""
-        filename = f"{date}_{username}.txt"
+    def _load_cached_observation(self, filename: str, stat_result=None) -> Optional[Dict]:
+        """Return parsed observation, re-reading the file only if its mtime or size changed"""
         filepath = os.path.join(self.observations_dir, filename)
+        if stat_result is None:
+            try:
+                stat_result = os.stat(filepath)
+            except FileNotFoundError:
+                with self._cache_lock:
+                    self._observation_cache.pop(filename, None)
+                return None
+        
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        with self._cache_lock:
+            cached = self._observation_cache.get(filename)
+            if cached is not None and cached[:2] == signature:
+                return cached[2]
+        
+        with open(filepath, "r", encoding="utf-8") as f:
+            obs_data = json.load(f)
+        
+        with self._cache_lock:
+            self._observation_cache[filename] = (signature[0], signature[1], obs_data)
+        return obs_data
+    
+    def _cache_observation(self, filename: str, obs_data: Dict):
+        """Store freshly written observation in the cache without re-reading it"""
+        filepath = os.path.join(self.observations_dir, filename)
+        try:
+            stat_result = os.stat(filepath)
+        except FileNotFoundError:
+            return
+        with self._cache_lock:
+            self._observation_cache[filename] = (stat_result.st_mtime_ns, stat_result.st_size, obs_data)
+    
+    def _get_observation_keys(self) -> List[tuple]:
+        """Get sorted (date, username) keys of all stored observations without opening any file"""
+        dir_mtime = os.stat(self.observations_dir).st_mtime_ns
+        with self._cache_lock:
+            if self._observation_keys_mtime == dir_mtime:
+                return self._observation_keys
+        
+        keys = []
+        for filename in os.listdir(self.observations_dir):
+            if not filename.endswith(".json"):
+                continue
+            # Dates never contain "_", so the first one separates date from username
+            obs_date, sep, username = filename[:-len(".json")].partition("_")
+            if sep:
+                keys.append((obs_date, username))
+        keys.sort()
+        
+        with self._cache_lock:
+            self._observation_keys = keys
+            self._observation_keys_mtime = dir_mtime
+        return keys
+    
+    def _invalidate_observation_keys(self):
+        """Force the next query to re-list the directory (guards against coarse mtimes)"""
+        with self._cache_lock:
+            self._observation_keys_mtime = None
+    
+    def _comment_paths(self, thread: str) -> tuple:
+        """Get (legacy JSON array path, JSONL log path) for a comment thread"""
+        legacy_path = os.path.join(self.comments_dir, f"{thread}_comments.json")
+        log_path = os.path.join(self.comments_dir, f"{thread}_comments.jsonl")
+        return legacy_path, log_path
+    
+    def _get_comment_threads(self) -> frozenset:
+        """Get "{date}_{username}" names of all comment threads, re-listing only when the directory changes"""
+        dir_mtime = os.stat(self.comments_dir).st_mtime_ns
+        with self._cache_lock:
+            if self._comment_threads_mtime == dir_mtime:
+                return self._comment_threads
+        
+        threads = set()
+        for filename in os.listdir(self.comments_dir):
+            for suffix in ("_comments.json", "_comments.jsonl"):
+                if filename.endswith(suffix):
+                    threads.add(filename[:-len(suffix)])
+        threads = frozenset(threads)
+        
+        with self._cache_lock:
+            self._comment_threads = threads
+            self._comment_threads_mtime = dir_mtime
+        return threads
+    
+    @staticmethod
+    def _parse_comment_lines(data: bytes, source: str) -> tuple:
+        """Parse complete JSONL lines, returning (comments, bytes consumed).
+        
+        A trailing line without newline is an append still in progress and is left for later.
+        """
+        consumed = data.rfind(b"\n") + 1
+        comments = []
+        for line in data[:consumed].splitlines():
+            if not line.strip():
+                continue
+            try:
+                comments.append(json.loads(line))
+            except ValueError as e:
+                print(f"Skipping malformed comment in {source}: {e}")
+        return comments, consumed
+    
+    def _load_cached_comments(self, thread: str) -> List[Dict]:
+        """Return parsed comment thread, reading only what changed since the last call"""
+        legacy_path, log_path = self._comment_paths(thread)
         
-        # Create content for text file
-        content = f"Zoo Observation Report\n"
-        content += f"========================\n"
-        content += f"Date: {date}\n"
-        content += f"Zoo Keeper: {username}\n"
-        content += f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        try:
+            legacy_stat = os.stat(legacy_path)
+            legacy_signature = (legacy_stat.st_mtime_ns, legacy_stat.st_size)
+        except FileNotFoundError:
+            legacy_signature = None
+        try:
+            log_stat = os.stat(log_path)
+            log_inode, log_size = log_stat.st_ino, log_stat.st_size
+        except FileNotFoundError:
+            log_inode, log_size = None, 0
+        
+        with self._cache_lock:
+            cached = self._comment_cache.get(thread)
+        
+        if cached is not None and cached[0] == legacy_signature and cached[1] == log_inode:
+            if cached[2] == log_size:
+                return cached[3]
+            if cached[2] < log_size:
+                # Only the appended tail is new
+                with open(log_path, "rb") as f:
+                    f.seek(cached[2])
+                    new_comments, consumed = self._parse_comment_lines(f.read(log_size - cached[2]), log_path)
+                comments = cached[3] + new_comments
+                with self._cache_lock:
+                    self._comment_cache[thread] = (legacy_signature, log_inode, cached[2] + consumed, comments)
+                return comments
+        
+        comments = []
+        if legacy_signature is not None:
+            try:
+                with open(legacy_path, "r", encoding="utf-8") as f:
+                    comments = json.load(f)
+            except Exception as e:
+                print(f"Error reading {legacy_path}: {e}")
         
-        content += f"Raw Observation:\n"
-        content += f"----------------\n"
-        content += f"{raw_observation}\n\n"
+        offset = 0
+        if log_inode is not None:
+            with open(log_path, "rb") as f:
+                log_comments, offset = self._parse_comment_lines(f.read(log_size), log_path)
+            comments = comments + log_comments
         
-        content += f"Structured Data:\n"
-        content += f"---------------\n"
-        for key, value in structured_data.items():
-            content += f"{key.replace('_', ' ').title()}: {value}\n"
+        if legacy_signature is None and log_inode is None:
+            with self._cache_lock:
+                self._comment_cache.pop(thread, None)
+            return comments
         
-        # Save to file
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        with self._cache_lock:
+            self._comment_cache[thread] = (legacy_signature, log_inode, offset, comments)
+        return comments
+    
+    @staticmethod
+    def _open_locked_log(log_path: str):
+        """Open a comment log for appending under an exclusive lock.
+        
+        Retries if compaction swapped the file out while we were waiting for the lock.
+        Closing the file releases the lock.
+        """
+        while True:
+            f = open(log_path, "a+b")
+            if fcntl is None:
+                return f
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                if os.fstat(f.fileno()).st_ino == os.stat(log_path).st_ino:
+                    return f
+            except FileNotFoundError:
+                pass
+            f.close()
+    
+    @staticmethod
+    def _atomic_write(path: str, content: bytes):
+        """Write file contents via a temp file and rename so readers never see a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp_")
+        try:
+            os.chmod(tmp_path, 0o644)
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def _bump_write_generation(self):
+        """Record that stored data changed, for this process and any other using the same data"""
+        with self._cache_lock:
+            self._write_generation += 1
+            token = f"{os.getpid()}-{time.time_ns()}-{self._write_generation}"
+        try:
+            self._atomic_write(self.generation_path, token.encode("utf-8"))
+        except Exception as e:
+            print(f"Error recording write generation: {e}")
+    
+    def get_write_generation(self) -> str:
+        """Opaque token that changes whenever any observation or comment is written or deleted"""
+        try:
+            with open(self.generation_path, "r", encoding="utf-8") as f:
+                token = f.read()
+        except FileNotFoundError:
+            token = ""
+        return f"{self._write_generation}:{token}"
+    
+    def _on_observation_saved(self, obs: Dict):
+        """Keep derived indexes in step with a saved observation"""
+        self._bump_write_generation()
+        try:
+            if self._search_index is None and self._rollups is None:
+                return
+            comments = self.get_comments(obs.get("date", ""), obs.get("username", ""))
+            if self._search_index is not None:
+                self._search_index.index_observation(obs, comments)
+            if self._rollups is not None:
+                self._rollups.record_observation(obs, len(comments))
+        except Exception as e:
+            print(f"Error updating indexes for saved observation: {e}")
+    
+    def _on_observation_deleted(self, date: str, username: str):
+        """Keep derived indexes in step with a deleted observation"""
+        self._bump_write_generation()
+        try:
+            if self._search_index is not None:
+                self._search_index.remove_observation(date, username)
+            if self._rollups is not None:
+                self._rollups.remove_observation(date, username)
+        except Exception as e:
+            print(f"Error updating indexes for deleted observation: {e}")
+    
+    def _on_comment_saved(self, comment: Dict):
+        """Keep derived indexes in step with a new comment"""
+        self._bump_write_generation()
+        try:
+            if self._search_index is not None:
+                self._search_index.add_comment(comment)
+            if self._rollups is not None:
+                self._rollups.add_comment(comment)
+        except Exception as e:
+            print(f"Error updating indexes for saved comment: {e}")
+    
+    def _get_search_index(self):
+        """Open the full-text index, catching up with changes made while it was closed"""
+        with self._search_index_lock:
+            if self._search_index is None:
+                from search_index import SearchIndex
+                index = SearchIndex(self.search_index_path)
+                index.sync(self)
+                self._search_index = index
+        return self._search_index
+    
+    def open_indexes(self):
+        """Open the search index and rollups so this process's writes keep them current.
+        
+        They are otherwise opened on first read; standalone writers (e.g. reextract)
+        call this first.
+        """
+        self._get_search_index()
+        self._get_rollups()
+    
+    def search_observations(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """Full-text search over raw text, structured text fields and comments.
+        
+        Every query term must match; results are ranked best first.
+        """
+        results = []
+        for obs_date, username in self._get_search_index().search(query, limit):
+            obs = self.get_observation(obs_date, username)
+            if obs is not None:
+                results.append(obs)
+        return results
+    
+    def _get_rollups(self):
+        """Open the dashboard rollups, catching up with changes made while they were closed"""
+        with self._rollups_lock:
+            if self._rollups is None:
+                from rollups import RollupStore
+                rollups = RollupStore(self.rollups_path)
+                rollups.sync(self)
+                self._rollups = rollups
+        return self._rollups
+    
+    def get_rollup_totals(self) -> Dict[str, int]:
+        """Observation and comment counters over all history, plus the number of keepers"""
+        return self._get_rollups().get_totals()
+    
+    def get_daily_rollups(self, start_date: str, end_date: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Per-day counters from start_date (through end_date), keyed by date"""
+        return self._get_rollups().get_daily(start_date, end_date)
+    
+    def get_keeper_rollups(self) -> List[Dict]:
+        """Per-keeper counters, most active first"""
+        return self._get_rollups().get_by_keeper()
+    
+    def get_animal_rollups(self) -> List[Dict]:
+        """Per-animal counters, most observed first"""
+        return self._get_rollups().get_by_animal()
+    
+    def _load_observations(self, keys) -> List[Dict]:
+        """Load observations for the given keys, newest first"""
+        observations = []
+        for obs_date, username in keys:
+            filename = f"{obs_date}_{username}.json"
+            try:
+                obs_data = self._load_cached_observation(filename)
+                if obs_data is not None:
+                    observations.append(obs_data)
+            except Exception as e:
+                print(f"Error reading {filename}: {e}")
+        
+        observations.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        return observations
+    
+    def save_observation(self, date: str, username: str, raw_observation: str, structured_data: dict,
+                         timestamp: Optional[str] = None) -> str:
+        """Save observation atomically as a single JSON file.
+        
+        timestamp keeps an existing submission time (e.g. when only the structured
+        data is regenerated); it defaults to now. The human-readable report is
+        rendered on demand by render_observation_report.
+        """
+        filename = f"{date}_{username}.json"
+        filepath = os.path.join(self.observations_dir, filename)
         
-        # Also save metadata as JSON for easier processing
         metadata = {
             "date": date,
             "username": username,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "raw_observation": raw_observation,
             "structured_data": structured_data,
             "filename": filename
         }
         
-        metadata_file = os.path.join(self.observations_dir, f"{date}_{username}.json")
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
+        self._atomic_write(filepath, json.dumps(metadata, indent=2).encode("utf-8"))
+        self._cache_observation(filename, metadata)
+        self._invalidate_observation_keys()
         
+        # Drop the stale text report written by older versions
+        legacy_txt = os.path.join(self.observations_dir, f"{date}_{username}.txt")
+        if os.path.exists(legacy_txt):
+            os.remove(legacy_txt)
+        
+        self._on_observation_saved(metadata)
         return filepath
     
+    @staticmethod
+    def render_observation_report(obs: Dict) -> str:
+        """Render the plain-text observation report for download"""
+        timestamp = obs.get("timestamp", "")
+        if timestamp:
+            timestamp = datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+        
+        lines = [
+            "Zoo Observation Report",
+            "========================",
+            f"Date: {obs.get('date', '')}",
+            f"Zoo Keeper: {obs.get('username', '')}",
+            f"Timestamp: {timestamp}",
+            "",
+            "Raw Observation:",
+            "----------------",
+            obs.get("raw_observation", ""),
+            "",
+            "Structured Data:",
+            "---------------",
+        ]
+        for key, value in obs.get("structured_data", {}).items():
+            lines.append(f"{key.replace('_', ' ').title()}: {value}")
+        
+        return "\n".join(lines) + "\n"
+    
     def get_observation(self, date: str, username: str) -> Optional[Dict]:
         """Get specific observation by date and username"""
-        metadata_file = os.path.join(self.observations_dir, f"{date}_{username}.json")
-        
-        if os.path.exists(metadata_file):
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return None
+        return self._load_cached_observation(f"{date}_{username}.json")
     
     def get_all_observations(self) -> List[Dict]:
-        """Get all observations sorted by date (newest first)"""
+        """Get all observations sorted by date (newest first).
+        
+        Returned dicts are shared with the cache; treat them as read-only.
+        """
         observations = []
+        seen = set()
         
-        for filename in os.listdir(self.observations_dir):
-            if filename.endswith(".json"):
-                filepath = os.path.join(self.observations_dir, filename)
+        with os.scandir(self.observations_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                seen.add(entry.name)
                 try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        obs_data = json.load(f)
+                    obs_data = self._load_cached_observation(entry.name, entry.stat())
+                    if obs_data is not None:
                         observations.append(obs_data)
                 except Exception as e:
-                    print(f"Error reading {filename}: {e}")
+                    print(f"Error reading {entry.name}: {e}")
+        
+        # Forget files that were removed behind our back
+        with self._cache_lock:
+            for filename in list(self._observation_cache):
+                if filename not in seen:
+                    del self._observation_cache[filename]
         
         # Sort by date (newest first)
         observations.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
         return observations
     
-    def get_observations_by_date_range(self, start_date: str, end_date: str) -> List[Dict]:
-        """Get observations within date range"""
-        all_observations = self.get_all_observations()
-        filtered = []
+    def get_observations_by_date_range(self, start_date: str, end_date: str,
+                                       username: Optional[str] = None) -> List[Dict]:
+        """Get observations within date range, optionally for one zoo keeper.
+        
+        Only files whose name falls inside the range are opened.
+        """
+        keys = self._get_observation_keys()
+        lo = bisect.bisect_left(keys, (start_date,))
+        # "\x00" sorts after end_date itself but before any later date
+        hi = bisect.bisect_left(keys, (end_date + "\x00",))
+        selected = keys[lo:hi]
         
-        for obs in all_observations:
-            obs_date = obs.get("date", "")
-            if start_date <= obs_date <= end_date:
-                filtered.append(obs)
+        if username is not None:
+            selected = [key for key in selected if key[1] == username]
         
-        return filtered
+        return self._load_observations(selected)
+    
+    def get_observations_by_user(self, username: str) -> List[Dict]:
+        """Get all observations by one zoo keeper, newest first"""
+        keys = [key for key in self._get_observation_keys() if key[1] == username]
+        return self._load_observations(keys)
+    
+    def get_keepers(self) -> List[str]:
+        """Get sorted usernames of all zoo keepers with at least one observation"""
+        return sorted(set(username for _, username in self._get_observation_keys()))
+    
+    @staticmethod
+    def _parse_cursor(cursor: Optional[str]) -> Optional[tuple]:
+        """Turn a "{date}_{username}" cursor back into a (date, username) key"""
+        if not cursor:
+            return None
+        obs_date, _, username = cursor.partition("_")
+        return (obs_date, username)
+    
+    @staticmethod
+    def _matches_filters(obs: Dict, filters: Dict) -> bool:
+        """Check the filters that can only be decided from file contents"""
+        animal_name = filters.get("animal_name")
+        if animal_name and obs.get("structured_data", {}).get("animal_name") != animal_name:
+            return False
+        return True
+    
+    def iter_observations(self, filters: Optional[Dict] = None, order: str = "desc",
+                          limit: int = 20, cursor: Optional[str] = None) -> tuple:
+        """Get one page of observations plus a cursor for the next page.
+        
+        filters may hold start_date, end_date, username and animal_name. Pages are
+        ordered by (date, username), "desc" for newest first or "asc", and files are
+        read one at a time only until the page is full. Returns
+        (observations, next_cursor); next_cursor is None on the last page.
+        """
+        filters = filters or {}
+        limit = max(1, limit)
+        keys = self._get_observation_keys()
+        
+        lo = bisect.bisect_left(keys, (filters["start_date"],)) if filters.get("start_date") else 0
+        hi = bisect.bisect_left(keys, (filters["end_date"] + "\x00",)) if filters.get("end_date") else len(keys)
+        
+        # Resume strictly after the cursor key
+        after = self._parse_cursor(cursor)
+        if after is not None:
+            if order == "desc":
+                hi = min(hi, bisect.bisect_left(keys, after))
+            else:
+                lo = max(lo, bisect.bisect_right(keys, after))
+        
+        positions = range(hi - 1, lo - 1, -1) if order == "desc" else range(lo, hi)
+        username = filters.get("username")
+        page = []
+        last_key = None
+        
+        for pos in positions:
+            key = keys[pos]
+            if username is not None and key[1] != username:
+                continue
+            try:
+                obs = self._load_cached_observation(f"{key[0]}_{key[1]}.json")
+            except Exception as e:
+                print(f"Error reading {key[0]}_{key[1]}.json: {e}")
+                continue
+            if obs is None or not self._matches_filters(obs, filters):
+                continue
+            if len(page) == limit:
+                # Found one more match, so there is a next page
+                return page, f"{last_key[0]}_{last_key[1]}"
+            page.append(obs)
+            last_key = key
+        
+        return page, None
     
     def save_comment(self, observation_date: str, observation_username: str, 
                     comment_author: str, comment_text: str, author_role: str) -> bool:
@@ -105,48 +568,85 @@ class DataManager:
             "timestamp": datetime.now().isoformat()
         }
         
-        # Create comment filename
-        comment_filename = f"{observation_date}_{observation_username}_comments.json"
-        comment_filepath = os.path.join(self.comments_dir, comment_filename)
+        line = (json.dumps(comment_data, ensure_ascii=False) + "\n").encode("utf-8")
+        _, log_path = self._comment_paths(f"{observation_date}_{observation_username}")
         
-        # Load existing comments or create new list
-        comments = []
-        if os.path.exists(comment_filepath):
-            try:
-                with open(comment_filepath, "r", encoding="utf-8") as f:
-                    comments = json.load(f)
-            except:
-                comments = []
-        
-        # Add new comment
-        comments.append(comment_data)
-        
-        # Save updated comments
+        # O(1) locked append to the thread's JSONL log
         try:
-            with open(comment_filepath, "w", encoding="utf-8") as f:
-                json.dump(comments, f, indent=2)
-            return True
+            with self._comment_write_lock, self._open_locked_log(log_path) as f:
+                # Never glue a new record onto a torn last line
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            with self._cache_lock:
+                self._comment_threads_mtime = None
         except Exception as e:
             print(f"Error saving comment: {e}")
             return False
+        
+        self._on_comment_saved(comment_data)
+        return True
     
     def get_comments(self, observation_date: str, observation_username: str) -> List[Dict]:
         """Get all comments for a specific observation"""
-        comment_filename = f"{observation_date}_{observation_username}_comments.json"
-        comment_filepath = os.path.join(self.comments_dir, comment_filename)
+        thread = f"{observation_date}_{observation_username}"
+        return [dict(comment) for comment in self._load_cached_comments(thread)]
+    
+    def get_comments_bulk(self, keys: Iterable[tuple]) -> Dict[tuple, List[Dict]]:
+        """Get comments for many (date, username) observation keys in one pass.
         
-        if os.path.exists(comment_filepath):
+        Observations without a comment file cost nothing; the rest come from the cache.
+        """
+        existing = self._get_comment_threads()
+        result = {}
+        for obs_date, username in keys:
+            thread = f"{obs_date}_{username}"
+            comments = self._load_cached_comments(thread) if thread in existing else []
+            result[(obs_date, username)] = [dict(comment) for comment in comments]
+        return result
+    
+    def iter_all_comments(self) -> Iterator[Dict]:
+        """Iterate over every stored comment, grouped by observation"""
+        for thread in sorted(self._get_comment_threads()):
+            for comment in self._load_cached_comments(thread):
+                yield dict(comment)
+    
+    def compact_comments(self) -> int:
+        """Rewrite every comment thread as one clean JSONL log.
+        
+        Folds legacy JSON arrays into the log and drops malformed lines. Returns
+        the number of threads rewritten.
+        """
+        compacted = 0
+        for thread in sorted(self._get_comment_threads()):
+            legacy_path, log_path = self._comment_paths(thread)
             try:
-                with open(comment_filepath, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except:
-                return []
-        return []
-    
-    def update_observation(self, date: str, username: str, raw_observation: str, structured_data: dict) -> bool:
-        """Update existing observation"""
+                with self._comment_write_lock, self._open_locked_log(log_path):
+                    with self._cache_lock:
+                        self._comment_cache.pop(thread, None)
+                    comments = self._load_cached_comments(thread)
+                    content = "".join(json.dumps(c, ensure_ascii=False) + "\n" for c in comments)
+                    self._atomic_write(log_path, content.encode("utf-8"))
+                    if os.path.exists(legacy_path):
+                        os.remove(legacy_path)
+                compacted += 1
+            except Exception as e:
+                print(f"Error compacting comments for {thread}: {e}")
+        
+        with self._cache_lock:
+            self._comment_threads_mtime = None
+        return compacted
+    
+    def update_observation(self, date: str, username: str, raw_observation: str, structured_data: dict,
+                           timestamp: Optional[str] = None) -> bool:
+        """Update existing observation (timestamp keeps its submission time, else it becomes now)"""
         try:
-            self.save_observation(date, username, raw_observation, structured_data)
+            self.save_observation(date, username, raw_observation, structured_data, timestamp)
             return True
         except Exception as e:
             print(f"Error updating observation: {e}")
@@ -155,7 +655,7 @@ class DataManager:
     def delete_observation(self, date: str, username: str) -> bool:
         """Delete observation and its comments"""
         try:
-            # Delete text file
+            # Delete text report left by older versions
             txt_file = os.path.join(self.observations_dir, f"{date}_{username}.txt")
             if os.path.exists(txt_file):
                 os.remove(txt_file)
@@ -164,16 +664,37 @@ class DataManager:
             json_file = os.path.join(self.observations_dir, f"{date}_{username}.json")
             if os.path.exists(json_file):
                 os.remove(json_file)
+            with self._cache_lock:
+                self._observation_cache.pop(f"{date}_{username}.json", None)
+            self._invalidate_observation_keys()
             
-            # Delete comments file
-            comment_file = os.path.join(self.comments_dir, f"{date}_{username}_comments.json")
-            if os.path.exists(comment_file):
-                os.remove(comment_file)
+            # Delete comment files (legacy JSON array and JSONL log)
+            with self._comment_write_lock:
+                for comment_file in self._comment_paths(f"{date}_{username}"):
+                    if os.path.exists(comment_file):
+                        os.remove(comment_file)
+            with self._cache_lock:
+                self._comment_cache.pop(f"{date}_{username}", None)
+                self._comment_threads_mtime = None
             
+            self._on_observation_deleted(date, username)
             return True
         except Exception as e:
             print(f"Error deleting observation: {e}")
             return False
+    
+    def get_observations_by_animal(self, animal_name: str) -> List[Dict]:
+        """Get all observations for a specific animal"""
+        return [obs for obs in self.get_all_observations()
+                if obs.get("structured_data", {}).get("animal_name") == animal_name]
+
+def create_data_manager() -> DataManager:
+    """Create the storage engine selected by ZOO_STORAGE_BACKEND ("files" or "sqlite")"""
+    backend = os.getenv("ZOO_STORAGE_BACKEND", "files").lower()
+    if backend == "sqlite":
+        from sqlite_store import SQLiteDataManager
+        return SQLiteDataManager(os.getenv("ZOO_SQLITE_PATH", "data/zoo.db"))
+    return DataManager()
 
 # Global data manager instance
-data_manager = DataManager()
+data_manager = create_data_manager()
@@ -0,0 +1,274 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from typing import List, Dict, Optional
+
+from sqlite_store import connect_sqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    date TEXT NOT NULL,
+    username TEXT NOT NULL,
+    observation_text TEXT NOT NULL DEFAULT '',
+    audio BLOB,
+    language TEXT NOT NULL DEFAULT 'hi',
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_user ON jobs (username, id);
+"""
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+SUPERSEDED = "superseded"
+
+FINISHED_STATES = (DONE, FAILED, SUPERSEDED)
+
+# Placeholder stored for voice observations until the transcript arrives
+PENDING_TRANSCRIPT = "🎤 Voice observation - transcription in progress"
+
+
+class JobQueue:
+    """Persistent queue of AI enrichment jobs, drained by a pool of worker threads.
+
+    Jobs live in SQLite, so they survive restarts. Running jobs have their lease
+    renewed by a heartbeat thread; a job left "running" by a process that died
+    is picked up again once its lease expires, until it runs out of attempts.
+    """
+
+    MAX_ATTEMPTS = 3
+    LEASE_SECONDS = 120
+    HEARTBEAT_SECONDS = 30
+    POLL_SECONDS = 2.0
+
+    def __init__(self, data_manager, db_path: str = "data/jobs.db", workers: int = 2):
+        self.data_manager = data_manager
+        self.db_path = db_path
+        self.workers = max(1, workers)
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._threads = []
+        self._start_lock = threading.Lock()
+        self._running = set()
+        self._running_lock = threading.Lock()
+        self._heartbeat = None
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connection(self):
+        """Get (or open) the connection for the current thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect_sqlite(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row_to_job(row) -> Dict:
+        """Convert a jobs row to a job dict (audio bytes left out)"""
+        job = {key: row[key] for key in row.keys() if key != "audio"}
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def start(self):
+        """Start the worker threads (idempotent)"""
+        with self._start_lock:
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f"zoo-job-worker-{len(self._threads)}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            if self._heartbeat is None or not self._heartbeat.is_alive():
+                self._heartbeat = threading.Thread(target=self._beat, name="zoo-job-heartbeat", daemon=True)
+                self._heartbeat.start()
+
+    def _enqueue(self, kind: str, date: str, username: str, observation_text: str = "",
+                 audio: Optional[bytes] = None, language: str = "hi") -> int:
+        """Insert a queued job and wake a worker"""
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (kind, date, username, observation_text, audio, language, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, date, username, observation_text, audio, language, QUEUED,
+                 datetime.now().isoformat(), time.time())
+            )
+        self.start()
+        self._wakeup.set()
+        return cursor.lastrowid
+
+    def submit_text(self, date: str, username: str, observation_text: str) -> int:
+        """Queue structuring of a text observation; returns the job id"""
+        return self._enqueue("text", date, username, observation_text=observation_text)
+
+    def submit_audio(self, date: str, username: str, audio_bytes: bytes, language: str = "hi") -> int:
+        """Queue transcription and structuring of a voice observation; returns the job id"""
+        return self._enqueue("audio", date, username, audio=audio_bytes, language=language)
+
+    def get_job(self, job_id: int) -> Optional[Dict]:
+        """Get a job by id"""
+        row = self._connection().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def get_active_jobs(self, username: str) -> List[Dict]:
+        """Get a keeper's queued or running jobs, oldest first"""
+        rows = self._connection().execute(
+            "SELECT * FROM jobs WHERE username = ? AND status IN (?, ?) ORDER BY id",
+            (username, QUEUED, RUNNING)
+        )
+        return [self._row_to_job(row) for row in rows]
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Atomically take the oldest runnable job (queued, or running with an expired lease)"""
+        conn = self._connection()
+        now = time.time()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # A job whose process died on every attempt (e.g. it crashes the worker) is not retried again
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? "
+                "WHERE status = ? AND updated_at < ? AND attempts >= ?",
+                (FAILED, "Worker stopped while processing (attempts exhausted)", now,
+                 RUNNING, now - self.LEASE_SECONDS, self.MAX_ATTEMPTS)
+            )
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? OR (status = ? AND updated_at < ? AND attempts < ?) "
+                "ORDER BY id LIMIT 1",
+                (QUEUED, RUNNING, now - self.LEASE_SECONDS, self.MAX_ATTEMPTS)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (RUNNING, now, row["id"])
+            )
+        return row
+
+    def _beat(self):
+        """Heartbeat loop: renew the lease of every job this process is running"""
+        while True:
+            time.sleep(self.HEARTBEAT_SECONDS)
+            with self._running_lock:
+                job_ids = list(self._running)
+            if not job_ids:
+                continue
+            try:
+                with self._connection() as conn:
+                    conn.execute(
+                        f"UPDATE jobs SET updated_at = ? WHERE status = ? AND id IN ({', '.join('?' * len(job_ids))})",
+                        (time.time(), RUNNING, *job_ids)
+                    )
+            except Exception as e:
+                print(f"Error renewing job leases: {e}")
+
+    def _finish(self, job_id: int, status: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        """Record a job's outcome and drop its audio payload"""
+        with self._connection() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, audio = NULL, updated_at = ? WHERE id = ?",
+                (status, json.dumps(result, ensure_ascii=False) if result is not None else None,
+                 error, time.time(), job_id)
+            )
+
+    def _is_superseded(self, row) -> bool:
+        """Whether the observation was deleted or a newer job was submitted for it"""
+        if self.data_manager.get_observation(row["date"], row["username"]) is None:
+            return True
+        newer = self._connection().execute(
+            "SELECT 1 FROM jobs WHERE date = ? AND username = ? AND id > ? LIMIT 1",
+            (row["date"], row["username"], row["id"])
+        ).fetchone()
+        return newer is not None
+
+    def _run(self, row):
+        """Run the AI step of one job and store the enriched observation"""
+        # Imported here so the queue (and app start-up) does not pay for the AI stack
+        from zoo_model import get_zoo_model
+        zoo_model = get_zoo_model()
+
+        if row["kind"] == "audio":
+            # A failed transcription raises, so the recording is kept and the job retried
+            observation_text, structured_data = zoo_model.process_audio_observation(
+                row["audio"] or b"", row["date"], language=row["language"]
+            )
+        else:
+            observation_text = row["observation_text"]
+            structured_data = zoo_model.process_observation(observation_text, row["date"])
+
+        if hasattr(structured_data, "dict"):
+            structured_dict = structured_data.dict()
+        else:
+            structured_dict = dict(structured_data)
+
+        # A later edit (or a delete) of the same observation wins over this older result
+        if self._is_superseded(row):
+            self._finish(row["id"], SUPERSEDED)
+            return
+
+        self.data_manager.save_observation(row["date"], row["username"], observation_text, structured_dict)
+        self._finish(row["id"], DONE, result={"observation_text": observation_text, "structured_data": structured_dict})
+
+    def _work(self):
+        """Worker loop: drain runnable jobs, then wait for a wake-up or the next poll"""
+        while True:
+            try:
+                row = self._claim()
+            except Exception as e:
+                print(f"Error claiming job: {e}")
+                row = None
+
+            if row is None:
+                self._wakeup.wait(self.POLL_SECONDS)
+                self._wakeup.clear()
+                continue
+
+            with self._running_lock:
+                self._running.add(row["id"])
+            try:
+                self._run(row)
+            except Exception as e:
+                print(f"Error processing job {row['id']}: {e}")
+                status = FAILED if row["attempts"] + 1 >= self.MAX_ATTEMPTS else QUEUED
+                try:
+                    with self._connection() as conn:
+                        conn.execute(
+                            "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                            (status, str(e), time.time(), row["id"])
+                        )
+                except Exception as update_error:
+                    print(f"Error updating job {row['id']}: {update_error}")
+            finally:
+                with self._running_lock:
+                    self._running.discard(row["id"])
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue, starting its workers on first use"""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            from data_manager import data_manager
+            _job_queue = JobQueue(
+                data_manager,
+                os.getenv("ZOO_JOBS_PATH", "data/jobs.db"),
+                workers=int(os.getenv("ZOO_JOB_WORKERS", "2"))
+            )
+            _job_queue.start()
+    return _job_queue
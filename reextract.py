@@ -0,0 +1,165 @@
+import os
+import json
+import argparse
+from typing import List, Dict, Optional
+
+from data_manager import data_manager, DataManager
+from job_queue import PENDING_TRANSCRIPT
+
+DEFAULT_CHECKPOINT = "data/reextract_checkpoint.json"
+
+
+def load_checkpoint(path: str) -> Optional[Dict]:
+    """Read a saved checkpoint, or None if there is none"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error reading checkpoint {path}: {e}")
+        return None
+
+def save_checkpoint(path: str, checkpoint: Dict):
+    """Write the checkpoint atomically so an interrupted run never leaves it half-written"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    DataManager._atomic_write(path, json.dumps(checkpoint, indent=2).encode("utf-8"))
+
+def diff_structured(old: Dict, new: Dict) -> List[tuple]:
+    """(field, old value, new value) for every field that changed"""
+    return [
+        (field, old.get(field), new.get(field))
+        for field in sorted(set(old) | set(new))
+        if field != "date_or_day" and old.get(field) != new.get(field)
+    ]
+
+def reextract_observations(filters: Optional[Dict] = None, batch_size: int = 20, concurrency: int = 4,
+                           rate: Optional[float] = None, dry_run: bool = False, restart: bool = False,
+                           checkpoint_path: str = DEFAULT_CHECKPOINT,
+                           manager: Optional[DataManager] = None) -> Dict[str, int]:
+    """Re-run structured extraction over stored observations, oldest first.
+
+    Progress is checkpointed after every batch, so an interrupted run resumes
+    where it stopped (unless restart is set or the filters or schema changed).
+    A dry run prints the field changes it would make and writes nothing.
+    Every observation goes to Gemini, and only Gemini results are ever saved.
+    """
+    from zoo_model import get_zoo_model, RateLimiter, SCHEMA_VERSION
+
+    manager = manager or data_manager
+    # Keep search and dashboards current with this process's writes
+    manager.open_indexes()
+    model = get_zoo_model()
+    filters = {key: value for key, value in (filters or {}).items() if value}
+    rate_limiter = RateLimiter(rate) if rate else None
+
+    stats = {"processed": 0, "changed": 0, "unchanged": 0, "skipped": 0, "failed": 0}
+    cursor = None
+
+    checkpoint = None if (restart or dry_run) else load_checkpoint(checkpoint_path)
+    if checkpoint:
+        if checkpoint.get("filters") == filters and checkpoint.get("schema_version") == SCHEMA_VERSION:
+            cursor = checkpoint.get("cursor")
+            stats.update(checkpoint.get("stats", {}))
+            print(f"Resuming after {cursor} ({stats['processed']} observations already processed)")
+        else:
+            print("Checkpoint was made with different filters or schema; starting over")
+
+    while True:
+        observations, next_cursor = manager.iter_observations(filters, order="asc", limit=batch_size, cursor=cursor)
+        if not observations:
+            break
+
+        # In-flight voice notes get their structured data from the job queue
+        batch = [obs for obs in observations if obs.get("raw_observation") != PENDING_TRANSCRIPT]
+        stats["skipped"] += len(observations) - len(batch)
+
+        results = model.process_observations_batch(
+            [(obs.get("raw_observation", ""), obs.get("date", "")) for obs in batch],
+            max_concurrency=concurrency,
+            rate_limiter=rate_limiter,
+            use_fast_path=False
+        )
+
+        for obs, outcome in zip(batch, results):
+            obs_date, username = obs.get("date", ""), obs.get("username", "")
+            stats["processed"] += 1
+
+            if outcome["source"] != "llm":
+                # Never replace real data with fallback or keyword-rule values
+                print(f"FAILED {obs_date} {username}: {outcome['error'] or outcome['source']}")
+                stats["failed"] += 1
+                continue
+
+            new_structured = outcome["result"].model_dump()
+            changes = diff_structured(obs.get("structured_data", {}), new_structured)
+            if not changes:
+                stats["unchanged"] += 1
+                continue
+
+            if dry_run:
+                print(f"{obs_date} {username}:")
+                for field, old_value, new_value in changes:
+                    print(f"  {field}: {old_value!r} -> {new_value!r}")
+                stats["changed"] += 1
+                continue
+
+            # Leave observations a keeper edited while this batch was running alone
+            current = manager.get_observation(obs_date, username)
+            if current is None or current.get("timestamp") != obs.get("timestamp"):
+                stats["skipped"] += 1
+                continue
+
+            # Keep the submission time, which also keeps this edit check meaningful for later runs
+            if manager.update_observation(obs_date, username, obs.get("raw_observation", ""), new_structured,
+                                          timestamp=current.get("timestamp")):
+                stats["changed"] += 1
+            else:
+                stats["failed"] += 1
+
+        cursor = next_cursor
+        if not dry_run:
+            save_checkpoint(checkpoint_path, {
+                "filters": filters,
+                "schema_version": SCHEMA_VERSION,
+                "cursor": cursor,
+                "stats": stats,
+            })
+        print(f"... {stats['processed']} processed, {stats['changed']} changed, {stats['failed']} failed")
+
+        if cursor is None:
+            break
+
+    # A finished run starts from the beginning next time
+    if not dry_run and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate structured data for stored observations")
+    parser.add_argument("--start-date", help="only observations on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--end-date", help="only observations on or before this date (YYYY-MM-DD)")
+    parser.add_argument("--username", help="only this keeper's observations")
+    parser.add_argument("--batch-size", type=int, default=20, help="observations per checkpointed batch")
+    parser.add_argument("--concurrency", type=int, default=4, help="parallel Gemini calls")
+    parser.add_argument("--rate", type=float, default=None, help="maximum Gemini calls per second")
+    parser.add_argument("--dry-run", action="store_true", help="print field changes without saving anything")
+    parser.add_argument("--restart", action="store_true", help="ignore any saved checkpoint")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="checkpoint file path")
+    args = parser.parse_args()
+
+    result = reextract_observations(
+        filters={"start_date": args.start_date, "end_date": args.end_date, "username": args.username},
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        dry_run=args.dry_run,
+        restart=args.restart,
+        checkpoint_path=args.checkpoint
+    )
+    print(f"Done: {result['processed']} processed, {result['changed']} changed, "
+          f"{result['unchanged']} unchanged, {result['skipped']} skipped, {result['failed']} failed")
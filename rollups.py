@@ -0,0 +1,227 @@
+import json
+import hashlib
+import threading
+from typing import List, Dict, Optional
+
+from sqlite_store import connect_sqlite
+
+# Counters kept per observation and summed into every rollup row
+COUNTERS = (
+    "observations",
+    "abnormal",
+    "on_time",
+    "normal_behaviour",
+    "clean_water",
+    "proper_feeding",
+    "clean_enclosure",
+    "comments",
+)
+
+# Rollup table -> grouping column
+ROLLUP_TABLES = {
+    "daily_rollups": "date",
+    "keeper_rollups": "username",
+    "animal_rollups": "animal_name",
+}
+
+_COUNTER_COLUMNS = ",\n".join(f"    {name} INTEGER NOT NULL DEFAULT 0" for name in COUNTERS)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS contributions (
+    doc_id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    username TEXT NOT NULL,
+    animal_name TEXT NOT NULL,
+    signature TEXT NOT NULL,
+{_COUNTER_COLUMNS}
+);
+""" + "".join(
+    f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    {column} TEXT PRIMARY KEY,
+{_COUNTER_COLUMNS}
+);
+""" for table, column in ROLLUP_TABLES.items()
+)
+
+def observation_counters(obs: Dict, comment_count: int) -> Dict[str, int]:
+    """Counter values one observation contributes to its rollup rows"""
+    structured = obs.get("structured_data", {})
+    return {
+        "observations": 1,
+        "abnormal": int(not structured.get("normal_behaviour_status", True)),
+        "on_time": int(bool(structured.get("animal_observed_on_time", False))),
+        "normal_behaviour": int(bool(structured.get("normal_behaviour_status", False))),
+        "clean_water": int(bool(structured.get("clean_drinking_water_provided", False))),
+        "proper_feeding": int(bool(structured.get("feed_given_as_prescribed", False))),
+        "clean_enclosure": int(bool(structured.get("enclosure_cleaned_properly", False))),
+        "comments": comment_count,
+    }
+
+
+class RollupStore:
+    """Per-day, per-keeper and per-animal aggregates, updated incrementally in SQLite.
+
+    Every observation's contribution is remembered so that an update or delete
+    can subtract exactly what was added before.
+    """
+
+    def __init__(self, db_path: str = "data/rollups.db"):
+        self.db_path = db_path
+        self._local = threading.local()
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connection(self):
+        """Get (or open) the connection for the current thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect_sqlite(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _doc_id(date: str, username: str) -> str:
+        """Rollup key of an observation, same as its storage key"""
+        return f"{date}_{username}"
+
+    @staticmethod
+    def _signature(obs: Dict, comment_count: int) -> str:
+        """Change marker for a counted observation: timestamp, content digest and comment count.
+
+        The digest catches rewrites that keep the submission time (re-extraction).
+        """
+        content = json.dumps([obs.get("raw_observation", ""), obs.get("structured_data") or {}],
+                             sort_keys=True, ensure_ascii=False)
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+        return f"{obs.get('timestamp', '')}|{digest}|{comment_count}"
+
+    @staticmethod
+    def _apply(conn, groups: Dict[str, str], counters: Dict[str, int], sign: int):
+        """Add (sign=1) or subtract (sign=-1) counters on each rollup row of an observation"""
+        values = [sign * counters.get(name, 0) for name in COUNTERS]
+        columns = ", ".join(COUNTERS)
+        placeholders = ", ".join("?" * len(COUNTERS))
+        updates = ", ".join(f"{name} = {name} + excluded.{name}" for name in COUNTERS)
+
+        for table, column in ROLLUP_TABLES.items():
+            conn.execute(
+                f"INSERT INTO {table} ({column}, {columns}) VALUES (?, {placeholders}) "
+                f"ON CONFLICT ({column}) DO UPDATE SET {updates}",
+                [groups[column]] + values
+            )
+            if sign < 0:
+                conn.execute(f"DELETE FROM {table} WHERE {column} = ? AND observations <= 0", (groups[column],))
+
+    def _remove_contribution(self, conn, doc_id: str):
+        """Subtract a stored contribution from the rollups and forget it"""
+        row = conn.execute("SELECT * FROM contributions WHERE doc_id = ?", (doc_id,)).fetchone()
+        if row is None:
+            return
+        self._apply(conn, dict(row), dict(row), -1)
+        conn.execute("DELETE FROM contributions WHERE doc_id = ?", (doc_id,))
+
+    def _write_contribution(self, conn, obs: Dict, comment_count: int):
+        """Replace an observation's contribution inside the caller's transaction"""
+        date, username = obs.get("date", ""), obs.get("username", "")
+        doc_id = self._doc_id(date, username)
+        self._remove_contribution(conn, doc_id)
+
+        groups = {
+            "date": date,
+            "username": username,
+            "animal_name": (obs.get("structured_data", {}).get("animal_name") or "").strip(),
+        }
+        counters = observation_counters(obs, comment_count)
+        self._apply(conn, groups, counters, 1)
+        conn.execute(
+            f"INSERT INTO contributions (doc_id, date, username, animal_name, signature, {', '.join(COUNTERS)}) "
+            f"VALUES (?, ?, ?, ?, ?, {', '.join('?' * len(COUNTERS))})",
+            [doc_id, date, username, groups["animal_name"], self._signature(obs, comment_count)]
+            + [counters[name] for name in COUNTERS]
+        )
+
+    def record_observation(self, obs: Dict, comment_count: int):
+        """Count a new or updated observation"""
+        with self._connection() as conn:
+            self._write_contribution(conn, obs, comment_count)
+
+    def add_comment(self, comment: Dict):
+        """Count one new comment on an already counted observation"""
+        doc_id = self._doc_id(comment.get("observation_date", ""), comment.get("observation_username", ""))
+
+        with self._connection() as conn:
+            row = conn.execute("SELECT * FROM contributions WHERE doc_id = ?", (doc_id,)).fetchone()
+            if row is None:
+                return
+            self._apply(conn, dict(row), {"comments": 1}, 1)
+            prefix, _, comment_count = row["signature"].rpartition("|")
+            conn.execute(
+                "UPDATE contributions SET comments = comments + 1, signature = ? WHERE doc_id = ?",
+                (f"{prefix}|{int(comment_count or 0) + 1}", doc_id)
+            )
+
+    def remove_observation(self, date: str, username: str):
+        """Stop counting a deleted observation"""
+        with self._connection() as conn:
+            self._remove_contribution(conn, self._doc_id(date, username))
+
+    def sync(self, data_manager) -> int:
+        """Bring the rollups up to date with storage, recounting only changed observations.
+
+        Returns the number of observations recounted or removed.
+        """
+        counted = {
+            row["doc_id"]: row["signature"]
+            for row in self._connection().execute("SELECT doc_id, signature FROM contributions")
+        }
+        observations = data_manager.get_all_observations()
+        comments_by_obs = data_manager.get_comments_bulk(
+            (obs.get("date", ""), obs.get("username", "")) for obs in observations
+        )
+
+        changed = 0
+        with self._connection() as conn:
+            for obs in observations:
+                key = (obs.get("date", ""), obs.get("username", ""))
+                comment_count = len(comments_by_obs.get(key, []))
+                if counted.pop(self._doc_id(*key), None) != self._signature(obs, comment_count):
+                    self._write_contribution(conn, obs, comment_count)
+                    changed += 1
+
+            # Whatever is left was deleted from storage
+            for doc_id in counted:
+                self._remove_contribution(conn, doc_id)
+                changed += 1
+        return changed
+
+    def get_totals(self) -> Dict[str, int]:
+        """Counters summed over all observations, plus the number of keepers"""
+        sums = ", ".join(f"COALESCE(SUM({name}), 0) AS {name}" for name in COUNTERS)
+        row = self._connection().execute(
+            f"SELECT COUNT(*) AS keepers, {sums} FROM keeper_rollups"
+        ).fetchone()
+        return dict(row)
+
+    def get_daily(self, start_date: str, end_date: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Daily counters for dates from start_date (through end_date), keyed by date"""
+        if end_date is None:
+            rows = self._connection().execute(
+                "SELECT * FROM daily_rollups WHERE date >= ? ORDER BY date", (start_date,)
+            )
+        else:
+            rows = self._connection().execute(
+                "SELECT * FROM daily_rollups WHERE date BETWEEN ? AND ? ORDER BY date", (start_date, end_date)
+            )
+        return {row["date"]: dict(row) for row in rows}
+
+    def get_by_keeper(self) -> List[Dict]:
+        """Counters per keeper, most observations first"""
+        rows = self._connection().execute("SELECT * FROM keeper_rollups ORDER BY observations DESC, username")
+        return [dict(row) for row in rows]
+
+    def get_by_animal(self) -> List[Dict]:
+        """Counters per animal, most observations first"""
+        rows = self._connection().execute("SELECT * FROM animal_rollups ORDER BY observations DESC, animal_name")
+        return [dict(row) for row in rows]
@@ -0,0 +1,239 @@
+import re
+import unicodedata
+from typing import List, Dict
+
+# Common zoo animals, Hindi and English spellings -> display name
+ANIMALS = {
+    "शेर": "Lion", "सिंह": "Lion", "lion": "Lion", "lioness": "Lion",
+    "बाघ": "Tiger", "tiger": "Tiger", "tigress": "Tiger",
+    "तेंदुआ": "Leopard", "तेंदुए": "Leopard", "leopard": "Leopard",
+    "हाथी": "Elephant", "elephant": "Elephant",
+    "भालू": "Bear", "bear": "Bear",
+    "हिरण": "Deer", "हिरन": "Deer", "deer": "Deer",
+    "चीतल": "Chital", "chital": "Chital", "सांभर": "Sambar", "sambar": "Sambar",
+    "नीलगाय": "Nilgai", "nilgai": "Nilgai",
+    "बंदर": "Monkey", "monkey": "Monkey", "लंगूर": "Langur", "langur": "Langur",
+    "मोर": "Peacock", "peacock": "Peacock", "peafowl": "Peacock",
+    "मगरमच्छ": "Crocodile", "घड़ियाल": "Gharial", "crocodile": "Crocodile", "gharial": "Gharial",
+    "जिराफ": "Giraffe", "giraffe": "Giraffe", "जेबरा": "Zebra", "zebra": "Zebra",
+    "गैंडा": "Rhinoceros", "गैंडे": "Rhinoceros", "rhino": "Rhinoceros", "rhinoceros": "Rhinoceros",
+    "दरियाई": "Hippopotamus", "hippo": "Hippopotamus", "hippopotamus": "Hippopotamus",
+    "भेड़िया": "Wolf", "wolf": "Wolf", "सियार": "Jackal", "jackal": "Jackal",
+    "लोमड़ी": "Fox", "fox": "Fox", "लकड़बग्घा": "Hyena", "hyena": "Hyena",
+    "सांप": "Snake", "साँप": "Snake", "अजगर": "Python", "snake": "Snake", "python": "Python",
+    "कछुआ": "Turtle", "turtle": "Turtle", "tortoise": "Tortoise",
+    "ऊंट": "Camel", "ऊँट": "Camel", "camel": "Camel",
+    "गेंडा": "Rhinoceros", "ज़ेबरा": "Zebra", "जिराफ़": "Giraffe",
+}
+
+# Words that flip the meaning of the clause they appear in
+NEGATIONS = {"नहीं", "नही", "न", "ना", "मत", "बिना", "not", "no", "never", "without", "didn't", "didnt",
+             "wasn't", "wasnt", "isn't", "isnt", "weren't", "hasn't", "haven't", "n't"}
+
+# field -> subject keywords, confirming words and words that mean the check failed
+FIELD_RULES = {
+    "clean_drinking_water_provided": {
+        "subject": {"पानी", "जल", "water", "drinking"},
+        "confirm": {"साफ", "स्वच्छ", "ताजा", "भरा", "भरे", "दिया", "बदला", "उपलब्ध", "clean", "fresh", "full",
+                    "filled", "refilled", "provided", "available", "changed", "given"},
+        "fail": {"गंदा", "गंदे", "गन्दा", "खाली", "dirty", "empty", "muddy", "contaminated"},
+    },
+    "enclosure_cleaned_properly": {
+        "subject": {"बाड़ा", "बाड़े", "बाड़े", "पिंजरा", "पिंजरे", "सफाई", "enclosure", "cage", "den", "pen",
+                    "paddock", "moat"},
+        "confirm": {"साफ", "सफाई", "स्वच्छ", "clean", "cleaned", "swept", "washed", "tidy"},
+        "fail": {"गंदा", "गंदे", "गन्दा", "कचरा", "dirty", "messy", "filthy", "uncleaned"},
+    },
+    "feed_given_as_prescribed": {
+        "subject": {"खाना", "भोजन", "आहार", "चारा", "मांस", "feed", "fed", "food", "meal", "meat", "diet",
+                    "feeding"},
+        "confirm": {"दिया", "दी", "खिलाया", "खाया", "खाई", "खा", "अनुसार", "given", "fed", "ate", "eaten",
+                    "prescribed", "scheduled", "finished", "consumed"},
+        "fail": {"छोड़", "छोड़ा", "कम", "refused", "skipped", "missed", "left", "uneaten"},
+    },
+    "feed_and_supplements_available": {
+        "subject": {"सप्लीमेंट", "विटामिन", "दवा", "चारा", "stock", "supplement", "supplements", "vitamin",
+                    "vitamins", "minerals"},
+        "confirm": {"उपलब्ध", "पर्याप्त", "दिया", "दिए", "available", "given", "adequate", "sufficient",
+                    "stocked", "added"},
+        "fail": {"खत्म", "ख़त्म", "कमी", "shortage", "unavailable", "finished", "out"},
+    },
+    "animal_observed_on_time": {
+        "subject": {"समय", "time", "schedule", "scheduled", "rounds", "seen", "दिखा", "दिखे",
+                    "दिखाई", "देखा"},
+        "confirm": {"पर", "निर्धारित", "दिखा", "दिखे", "दिखाई", "देखा", "on", "scheduled", "seen", "observed",
+                    "spotted"},
+        "fail": {"देर", "देरी", "late", "delayed", "missing", "hidden", "absent"},
+    },
+}
+
+# Behaviour cues: any abnormal cue marks the animal as not behaving normally
+ABNORMAL_CUES = {"बीमार", "सुस्त", "लंगड़ा", "लंगड़ाना", "लंगड़ा", "घाव", "घायल", "बुखार", "उल्टी", "दस्त",
+                 "खून", "चोट", "कमजोर", "आक्रामक", "बेचैन", "sick", "ill", "lethargic", "limping", "limp",
+                 "injured", "injury", "wound", "wounded", "fever", "vomiting", "vomit", "diarrhea",
+                 "diarrhoea", "bleeding", "weak", "aggressive", "restless", "abnormal", "lame", "coughing",
+                 "cough", "swollen", "swelling", "pus", "discharge", "discharging", "खांस", "खांसी", "खाँसी",
+                 "सूजन", "सूजा", "मवाद"}
+NORMAL_CUES = {"सामान्य", "सक्रिय", "स्वस्थ", "ठीक", "चुस्त", "normal", "active", "healthy", "alert",
+               "fine", "playful", "well"}
+
+# Conjunctions that contrast a clause with the one before it ("water given but not drunk")
+CONTRASTS = {"लेकिन", "परंतु", "परन्तु", "किंतु", "किन्तु", "मगर", "but", "however", "while"}
+
+# Words a clause may contain besides animal names and still count as understood ("the lion is ...")
+FILLERS = {"the", "a", "an", "is", "was", "are", "were", "today", "आज", "है", "हैं", "था", "थे", "थी",
+           "ने", "का", "की", "के", "को"}
+
+# Confidence of a field set by an explicit cue, by a bare mention and by no mention at all
+STRONG, WEAK, ASSUMED = 0.95, 0.7, 0.3
+
+CLAUSE_SPLIT_RE = re.compile(r"[।॥.!?;,\n]+|\s(?:और|लेकिन|परंतु|परन्तु|किंतु|किन्तु|मगर|and|but|however|while)\s")
+# Letters, digits, Devanagari combining marks (as in search_index) and apostrophes ("didn't")
+WORD_RE = re.compile(r"(?:[^\W_]|[\u0900-\u0963\u0966-\u097F]|')+")
+
+
+def _words(clause: str) -> List[str]:
+    """Lower-cased words of a clause, with Devanagari nukta dropped"""
+    clause = unicodedata.normalize("NFC", clause).casefold().replace("\u093c", "")
+    return WORD_RE.findall(clause)
+
+def _split_linked(text: str) -> List[tuple]:
+    """Split text into (words, contrasted) clauses; contrasted means it follows "but"/"लेकिन" and the like"""
+    text = text or ""
+    clauses = []
+    start, contrasted = 0, False
+    for match in CLAUSE_SPLIT_RE.finditer(text):
+        words = _words(text[start:match.start()])
+        if words:
+            clauses.append((words, contrasted or words[0] in _CONTRASTS))
+            contrasted = False
+        # A contrast may follow punctuation (", but"), so keep it until a clause takes it
+        contrasted = contrasted or match.group().strip().casefold() in _CONTRASTS
+        start = match.end()
+    words = _words(text[start:])
+    if words:
+        clauses.append((words, contrasted or words[0] in _CONTRASTS))
+    return clauses
+
+def _is_negated(words: List[str]) -> bool:
+    """Whether a clause contains a negation"""
+    return any(word in NEGATIONS or word.endswith("n't") for word in words)
+
+def _fold(word_set):
+    """Normalize a keyword set the same way clause words are"""
+    return {word for keyword in word_set for word in _words(keyword)}
+
+_FOLDED_RULES = {
+    field: {part: _fold(keywords) for part, keywords in rules.items()}
+    for field, rules in FIELD_RULES.items()
+}
+_FOLDED_ANIMALS = {_words(name)[0]: animal for name, animal in ANIMALS.items()}
+_ABNORMAL = _fold(ABNORMAL_CUES)
+_NORMAL = _fold(NORMAL_CUES)
+_CONTRASTS = _fold(CONTRASTS)
+_FILLERS = _fold(FILLERS)
+
+
+def _decide(votes: List[tuple]) -> tuple:
+    """Combine (value, confidence) votes into one value and confidence"""
+    if not votes:
+        return True, ASSUMED
+    values = {value for value, _ in votes}
+    if len(values) == 1:
+        return votes[0][0], max(confidence for _, confidence in votes)
+    # Conflicting statements: trust the stronger side, but not much
+    positive = sum(confidence for value, confidence in votes if value)
+    negative = sum(confidence for value, confidence in votes if not value)
+    return positive > negative, 0.4
+
+def _animal_of(word: str):
+    """Display name if word is an animal (English plurals like "lions" count too), else None"""
+    return _FOLDED_ANIMALS.get(word) or _FOLDED_ANIMALS.get(word.removesuffix("es")) \
+        or _FOLDED_ANIMALS.get(word.removesuffix("s"))
+
+def extract_with_rules(text: str) -> Dict:
+    """Fill the checklist fields of an observation from keywords.
+
+    Returns {"values": {...}, "confidence": {...}, "abnormal_details": str or None,
+    "unmatched_clauses": [...]}. Fields never mentioned default to True with low
+    confidence; unmatched_clauses lists the clauses no rule could interpret.
+    """
+    clauses = _split_linked(text)
+    values, confidence = {}, {}
+    understood = [False] * len(clauses)
+
+    # Checklist booleans
+    for field, rules in _FOLDED_RULES.items():
+        votes = []
+        for position, (words, contrasted) in enumerate(clauses):
+            word_set = set(words)
+            negated = _is_negated(words)
+            if not word_set & rules["subject"]:
+                # "Meat given but tiger did not touch it": a negated contrast
+                # clause without its own subject contradicts the clause before
+                previous = set(clauses[position - 1][0]) if position else set()
+                if contrasted and negated and previous & rules["subject"] \
+                        and not word_set & (_ABNORMAL | _NORMAL):
+                    votes.append((False, STRONG))
+                    understood[position] = True
+                continue
+            if word_set & rules["fail"]:
+                votes.append((negated, STRONG))
+                understood[position] = True
+            elif word_set & rules["confirm"]:
+                votes.append((not negated, STRONG))
+                understood[position] = True
+            else:
+                # A bare mention says nothing certain about the field
+                votes.append((not negated, WEAK))
+        values[field], confidence[field] = _decide(votes)
+
+    # Behaviour
+    votes, abnormal_clauses = [], []
+    for position, (words, _) in enumerate(clauses):
+        word_set = set(words)
+        negated = _is_negated(words)
+        if word_set & _ABNORMAL:
+            votes.append((negated, STRONG))
+            understood[position] = True
+            if not negated:
+                abnormal_clauses.append(" ".join(words))
+        elif word_set & _NORMAL:
+            votes.append((not negated, STRONG if not negated else WEAK))
+            understood[position] = True
+    if any(value is False for value, _ in votes):
+        # A single abnormal sign is enough to flag the animal
+        values["normal_behaviour_status"] = False
+        confidence["normal_behaviour_status"] = STRONG
+    else:
+        values["normal_behaviour_status"], confidence["normal_behaviour_status"] = _decide(votes)
+
+    # Animal (first one mentioned); a clause naming only the animal is understood too
+    animal_name = None
+    for position, (words, _) in enumerate(clauses):
+        for word in words:
+            animal_name = animal_name or _animal_of(word)
+        if all(word in _FILLERS or _animal_of(word) for word in words):
+            understood[position] = True
+    values["animal_name"] = animal_name
+    confidence["animal_name"] = STRONG if animal_name else 0.0
+
+    return {
+        "values": values,
+        "confidence": confidence,
+        "abnormal_details": "; ".join(abnormal_clauses) or None,
+        "unmatched_clauses": [" ".join(words) for (words, _), ok in zip(clauses, understood) if not ok],
+    }
+
+def is_confident(extraction: Dict, threshold: float) -> bool:
+    """Whether the rules alone are trustworthy enough to skip the LLM.
+
+    Every clause must have been interpreted by some rule, and abnormal
+    behaviour always needs the LLM's free-text details.
+    """
+    values, confidence = extraction["values"], extraction["confidence"]
+    return (
+        values.get("normal_behaviour_status", False)
+        and not extraction.get("unmatched_clauses", True)
+        and all(score >= threshold for score in confidence.values())
+    )
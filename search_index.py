@@ -0,0 +1,233 @@
+import re
+import json
+import math
+import hashlib
+import threading
+import unicodedata
+from collections import Counter
+from typing import List, Dict, Optional, Iterable
+
+from sqlite_store import connect_sqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    username TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    signature TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_postings_doc ON postings (doc_id);
+"""
+
+# Letters, digits and Devanagari combining marks (matras, virama, anusvara).
+# The danda "।" and double danda "॥" (U+0964, U+0965) act as separators.
+TOKEN_RE = re.compile(r"(?:[^\W_]|[\u0900-\u0963\u0966-\u097F])+")
+
+# Frequent Hindi and English function words that carry no search value
+STOPWORDS = frozenset([
+    "का", "की", "के", "को", "में", "से", "है", "हैं", "था", "थे", "थी", "और", "पर",
+    "ने", "भी", "तो", "यह", "वह", "एक", "हो", "गया", "गई",
+    "the", "a", "an", "and", "or", "of", "to", "in", "is", "was", "are", "were",
+    "on", "at", "for", "with", "be", "it",
+])
+
+# Devanagari digits ०-९ searched as ASCII digits
+DIGIT_MAP = {0x0966 + i: str(i) for i in range(10)}
+
+# Spelling variants folded together: nukta dropped, chandrabindu -> anusvara,
+# zero-width joiners removed
+CHAR_MAP = {0x093C: None, 0x0901: "\u0902", 0x200C: None, 0x200D: None, **DIGIT_MAP}
+
+def normalize_text(text: str) -> str:
+    """Normalize text for indexing: Unicode NFC, case folding and Devanagari variant folding"""
+    # NFC decomposes the precomposed nukta letters (क़, ज़, ...) so the nukta can be dropped
+    text = unicodedata.normalize("NFC", text).casefold()
+    return text.translate(CHAR_MAP)
+
+def tokenize(text: str) -> List[str]:
+    """Split text into normalized search terms, skipping stopwords"""
+    return [token for token in TOKEN_RE.findall(normalize_text(text or "")) if token not in STOPWORDS]
+
+def observation_text(obs: Dict, comments: Iterable[Dict] = ()) -> str:
+    """Collect the searchable text of an observation: raw text, structured text fields and comments"""
+    parts = [obs.get("raw_observation", "")]
+    for value in obs.get("structured_data", {}).values():
+        if isinstance(value, str):
+            parts.append(value)
+    for comment in comments:
+        parts.append(comment.get("comment_text", ""))
+    return "\n".join(parts)
+
+
+class SearchIndex:
+    """Persistent inverted index over observations, stored in SQLite and ranked with BM25"""
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, db_path: str = "data/search_index.db"):
+        self.db_path = db_path
+        self._local = threading.local()
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connection(self):
+        """Get (or open) the connection for the current thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect_sqlite(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _doc_id(date: str, username: str) -> str:
+        """Index key of an observation, same as its storage key"""
+        return f"{date}_{username}"
+
+    @staticmethod
+    def _signature(obs: Dict, comment_count: int) -> str:
+        """Change marker for an indexed observation: timestamp, content digest and comment count.
+
+        The digest catches rewrites that keep the submission time (re-extraction).
+        """
+        content = json.dumps([obs.get("raw_observation", ""), obs.get("structured_data") or {}],
+                             sort_keys=True, ensure_ascii=False)
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+        return f"{obs.get('timestamp', '')}|{digest}|{comment_count}"
+
+    def _write_document(self, conn, obs: Dict, comments: List[Dict]):
+        """Replace the postings of one observation inside the caller's transaction"""
+        date, username = obs.get("date", ""), obs.get("username", "")
+        doc_id = self._doc_id(date, username)
+        counts = Counter(tokenize(observation_text(obs, comments)))
+
+        conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        conn.executemany(
+            "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+            [(term, doc_id, tf) for term, tf in counts.items()]
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO documents (doc_id, date, username, length, signature) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (doc_id, date, username, sum(counts.values()), self._signature(obs, len(comments)))
+        )
+
+    def index_observation(self, obs: Dict, comments: List[Dict]):
+        """(Re)index one observation together with its comments"""
+        with self._connection() as conn:
+            self._write_document(conn, obs, comments)
+
+    def add_comment(self, comment: Dict):
+        """Add one new comment's terms to an already indexed observation"""
+        doc_id = self._doc_id(comment.get("observation_date", ""), comment.get("observation_username", ""))
+        counts = Counter(tokenize(comment.get("comment_text", "")))
+
+        with self._connection() as conn:
+            row = conn.execute("SELECT signature FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+            if row is None:
+                return
+            conn.executemany(
+                "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?) "
+                "ON CONFLICT (term, doc_id) DO UPDATE SET tf = tf + excluded.tf",
+                [(term, doc_id, tf) for term, tf in counts.items()]
+            )
+            prefix, _, comment_count = row["signature"].rpartition("|")
+            conn.execute(
+                "UPDATE documents SET length = length + ?, signature = ? WHERE doc_id = ?",
+                (sum(counts.values()), f"{prefix}|{int(comment_count or 0) + 1}", doc_id)
+            )
+
+    def remove_observation(self, date: str, username: str):
+        """Drop an observation from the index"""
+        doc_id = self._doc_id(date, username)
+        with self._connection() as conn:
+            conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+            conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+
+    def sync(self, data_manager) -> int:
+        """Bring the index up to date with storage, reindexing only changed observations.
+
+        Returns the number of observations (re)indexed or removed.
+        """
+        indexed = {
+            row["doc_id"]: row["signature"]
+            for row in self._connection().execute("SELECT doc_id, signature FROM documents")
+        }
+        observations = data_manager.get_all_observations()
+        comments_by_obs = data_manager.get_comments_bulk(
+            (obs.get("date", ""), obs.get("username", "")) for obs in observations
+        )
+
+        changed = 0
+        # One transaction for the whole catch-up instead of one per observation
+        with self._connection() as conn:
+            for obs in observations:
+                key = (obs.get("date", ""), obs.get("username", ""))
+                comments = comments_by_obs.get(key, [])
+                if indexed.pop(self._doc_id(*key), None) != self._signature(obs, len(comments)):
+                    self._write_document(conn, obs, comments)
+                    changed += 1
+
+            # Whatever is left was deleted from storage
+            for doc_id in indexed:
+                conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+                conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+                changed += 1
+        return changed
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[tuple]:
+        """Find observations containing every query term.
+
+        Returns (date, username) keys ordered by BM25 score, best first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        conn = self._connection()
+        placeholders = ", ".join("?" * len(terms))
+        doc_freq = {
+            row["term"]: row["df"]
+            for row in conn.execute(
+                f"SELECT term, COUNT(*) AS df FROM postings WHERE term IN ({placeholders}) GROUP BY term",
+                terms
+            )
+        }
+        if len(doc_freq) < len(terms):
+            # Some term occurs nowhere, so no document can contain all of them
+            return []
+
+        total_docs, avg_length = conn.execute("SELECT COUNT(*), AVG(length) FROM documents").fetchone()
+        avg_length = avg_length or 1
+
+        # Intersection (AND) and BM25 scoring both run inside SQLite
+        weights = []
+        for term in terms:
+            df = doc_freq[term]
+            weights.extend([term, math.log(1 + (total_docs - df + 0.5) / (df + 0.5))])
+        values = ", ".join(["(?, ?)"] * len(terms))
+        sql = f"""
+            WITH weights (term, idf) AS (VALUES {values})
+            SELECT d.date, d.username,
+                   SUM(w.idf * p.tf * (? + 1) / (p.tf + ? * (1 - ? + ? * d.length / ?))) AS score
+            FROM weights w
+            JOIN postings p ON p.term = w.term
+            JOIN documents d ON d.doc_id = p.doc_id
+            GROUP BY p.doc_id
+            HAVING COUNT(*) = ?
+            ORDER BY score DESC, d.date, d.username
+            LIMIT ?
+        """
+        params = weights + [self.K1, self.K1, self.B, self.B, avg_length, len(terms),
+                            -1 if limit is None else limit]
+        return [(row["date"], row["username"]) for row in conn.execute(sql, params)]
@@ -0,0 +1,343 @@
+import os
+import json
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+from typing import List, Dict, Optional, Iterable, Iterator
+
+from data_manager import DataManager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    date TEXT NOT NULL,
+    username TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    raw_observation TEXT NOT NULL,
+    structured_data TEXT NOT NULL,
+    filename TEXT,
+    PRIMARY KEY (date, username)
+);
+
+-- The primary key already serves as the date index; these cover the other lookups
+CREATE INDEX IF NOT EXISTS idx_observations_username
+    ON observations (username, date);
+CREATE INDEX IF NOT EXISTS idx_observations_animal
+    ON observations (json_extract(structured_data, '$.animal_name'));
+
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    observation_date TEXT NOT NULL,
+    observation_username TEXT NOT NULL,
+    comment_author TEXT NOT NULL,
+    author_role TEXT NOT NULL,
+    comment_text TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_comments_observation
+    ON comments (observation_date, observation_username, id);
+"""
+
+
+def connect_sqlite(db_path: str) -> sqlite3.Connection:
+    """Open a SQLite connection in WAL mode with sensible defaults"""
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SQLiteDataManager(DataManager):
+    """DataManager backed by a single SQLite database instead of flat JSON files"""
+
+    def __init__(self, db_path: str = "data/zoo.db"):
+        super().__init__()
+        self.db_path = db_path
+
+        # One connection per thread; Streamlit runs every session in its own thread
+        self._local = threading.local()
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get (or open) the connection for the current thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect_sqlite(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row_to_observation(row) -> Dict:
+        """Convert an observations row into the dict shape used by the file backend"""
+        return {
+            "date": row["date"],
+            "username": row["username"],
+            "timestamp": row["timestamp"],
+            "raw_observation": row["raw_observation"],
+            "structured_data": json.loads(row["structured_data"]),
+            "filename": row["filename"]
+        }
+
+    @staticmethod
+    def _row_to_comment(row) -> Dict:
+        """Convert a comments row into the dict shape used by the file backend"""
+        return {
+            "observation_date": row["observation_date"],
+            "observation_username": row["observation_username"],
+            "comment_author": row["comment_author"],
+            "author_role": row["author_role"],
+            "comment_text": row["comment_text"],
+            "timestamp": row["timestamp"]
+        }
+
+    def _query_observations(self, where: str = "", params: tuple = ()) -> List[Dict]:
+        """Run an observations query, newest first"""
+        sql = "SELECT * FROM observations"
+        if where:
+            sql += f" WHERE {where}"
+        sql += " ORDER BY timestamp DESC"
+        rows = self._connection().execute(sql, params).fetchall()
+        return [self._row_to_observation(row) for row in rows]
+
+    def save_observation(self, date: str, username: str, raw_observation: str, structured_data: dict,
+                         timestamp: Optional[str] = None) -> str:
+        """Save (insert or replace) observation row; timestamp keeps an existing submission time"""
+        obs = {
+            "date": date,
+            "username": username,
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "raw_observation": raw_observation,
+            "structured_data": structured_data,
+            "filename": f"{date}_{username}.json"
+        }
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO observations "
+                "(date, username, timestamp, raw_observation, structured_data, filename) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (date, username, obs["timestamp"], raw_observation,
+                 json.dumps(structured_data), obs["filename"])
+            )
+        self._on_observation_saved(obs)
+        return f"{self.db_path}#{date}_{username}"
+
+    def get_observation(self, date: str, username: str) -> Optional[Dict]:
+        """Get specific observation by date and username"""
+        row = self._connection().execute(
+            "SELECT * FROM observations WHERE date = ? AND username = ?",
+            (date, username)
+        ).fetchone()
+        return self._row_to_observation(row) if row else None
+
+    def get_all_observations(self) -> List[Dict]:
+        """Get all observations sorted by date (newest first)"""
+        return self._query_observations()
+
+    def get_observations_by_date_range(self, start_date: str, end_date: str,
+                                       username: Optional[str] = None) -> List[Dict]:
+        """Get observations within date range using the date index"""
+        if username is not None:
+            return self._query_observations(
+                "username = ? AND date BETWEEN ? AND ?", (username, start_date, end_date)
+            )
+        return self._query_observations("date BETWEEN ? AND ?", (start_date, end_date))
+
+    def get_observations_by_user(self, username: str) -> List[Dict]:
+        """Get all observations by one zoo keeper using the username index"""
+        return self._query_observations("username = ?", (username,))
+
+    def get_keepers(self) -> List[str]:
+        """Get sorted usernames of all zoo keepers with at least one observation"""
+        rows = self._connection().execute(
+            "SELECT DISTINCT username FROM observations ORDER BY username"
+        ).fetchall()
+        return [row["username"] for row in rows]
+
+    def get_observations_by_animal(self, animal_name: str) -> List[Dict]:
+        """Get all observations for an animal using the animal_name index"""
+        return self._query_observations(
+            "json_extract(structured_data, '$.animal_name') = ?", (animal_name,)
+        )
+
+    def iter_observations(self, filters: Optional[Dict] = None, order: str = "desc",
+                          limit: int = 20, cursor: Optional[str] = None) -> tuple:
+        """Get one page of observations plus a cursor for the next page (keyset pagination)"""
+        filters = filters or {}
+        limit = max(1, limit)
+        clauses, params = [], []
+
+        if filters.get("start_date"):
+            clauses.append("date >= ?")
+            params.append(filters["start_date"])
+        if filters.get("end_date"):
+            clauses.append("date <= ?")
+            params.append(filters["end_date"])
+        if filters.get("username") is not None:
+            clauses.append("username = ?")
+            params.append(filters["username"])
+        if filters.get("animal_name"):
+            clauses.append("json_extract(structured_data, '$.animal_name') = ?")
+            params.append(filters["animal_name"])
+
+        after = self._parse_cursor(cursor)
+        if after is not None:
+            clauses.append("(date, username) < (?, ?)" if order == "desc" else "(date, username) > (?, ?)")
+            params.extend(after)
+
+        direction = "DESC" if order == "desc" else "ASC"
+        sql = "SELECT * FROM observations"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY date {direction}, username {direction} LIMIT ?"
+        params.append(limit + 1)
+
+        rows = self._connection().execute(sql, params).fetchall()
+        page = [self._row_to_observation(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = f"{page[-1]['date']}_{page[-1]['username']}"
+        return page, next_cursor
+
+    def save_comment(self, observation_date: str, observation_username: str,
+                    comment_author: str, comment_text: str, author_role: str) -> bool:
+        """Save comment for an observation"""
+        comment = {
+            "observation_date": observation_date,
+            "observation_username": observation_username,
+            "comment_author": comment_author,
+            "author_role": author_role,
+            "comment_text": comment_text,
+            "timestamp": datetime.now().isoformat()
+        }
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT INTO comments (observation_date, observation_username, comment_author, "
+                    "author_role, comment_text, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+                    (observation_date, observation_username, comment_author,
+                     author_role, comment_text, comment["timestamp"])
+                )
+        except Exception as e:
+            print(f"Error saving comment: {e}")
+            return False
+
+        self._on_comment_saved(comment)
+        return True
+
+    def get_comments(self, observation_date: str, observation_username: str) -> List[Dict]:
+        """Get all comments for a specific observation, oldest first"""
+        rows = self._connection().execute(
+            "SELECT * FROM comments WHERE observation_date = ? AND observation_username = ? ORDER BY id",
+            (observation_date, observation_username)
+        ).fetchall()
+        return [self._row_to_comment(row) for row in rows]
+
+    def get_comments_bulk(self, keys: Iterable[tuple]) -> Dict[tuple, List[Dict]]:
+        """Get comments for many (date, username) observation keys with a few indexed queries"""
+        keys = list(dict.fromkeys(keys))
+        result = {key: [] for key in keys}
+        conn = self._connection()
+
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 400):
+            chunk = keys[start:start + 400]
+            placeholders = ", ".join(["(?, ?)"] * len(chunk))
+            params = [value for key in chunk for value in key]
+            rows = conn.execute(
+                f"SELECT * FROM comments WHERE (observation_date, observation_username) "
+                f"IN (VALUES {placeholders}) ORDER BY id",
+                params
+            ).fetchall()
+            for row in rows:
+                result[(row["observation_date"], row["observation_username"])].append(self._row_to_comment(row))
+        return result
+
+    def iter_all_comments(self) -> Iterator[Dict]:
+        """Iterate over every stored comment, grouped by observation"""
+        cursor = self._connection().execute(
+            "SELECT * FROM comments ORDER BY observation_date, observation_username, id"
+        )
+        for row in cursor:
+            yield self._row_to_comment(row)
+
+    def compact_comments(self) -> int:
+        """Comments are plain rows here; there are no logs to compact"""
+        return 0
+
+    def delete_observation(self, date: str, username: str) -> bool:
+        """Delete observation and its comments"""
+        try:
+            with self._connection() as conn:
+                conn.execute("DELETE FROM observations WHERE date = ? AND username = ?", (date, username))
+                conn.execute(
+                    "DELETE FROM comments WHERE observation_date = ? AND observation_username = ?",
+                    (date, username)
+                )
+        except Exception as e:
+            print(f"Error deleting observation: {e}")
+            return False
+
+        self._on_observation_deleted(date, username)
+        return True
+
+
+def migrate_json_to_sqlite(db_path: str = "data/zoo.db", source: Optional[DataManager] = None) -> Dict[str, int]:
+    """Copy every JSON observation and comment file into the SQLite database.
+
+    Safe to re-run: each observation and its comment thread is replaced as a unit.
+    """
+    source = source or DataManager()
+    target = SQLiteDataManager(db_path)
+    conn = target._connection()
+    stats = {"observations": 0, "comments": 0}
+
+    with conn:
+        for obs in source.get_all_observations():
+            conn.execute(
+                "INSERT OR REPLACE INTO observations "
+                "(date, username, timestamp, raw_observation, structured_data, filename) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (obs.get("date", ""), obs.get("username", ""), obs.get("timestamp", ""),
+                 obs.get("raw_observation", ""), json.dumps(obs.get("structured_data", {})),
+                 obs.get("filename"))
+            )
+            stats["observations"] += 1
+
+        threads = {}
+        for comment in source.iter_all_comments():
+            key = (comment.get("observation_date", ""), comment.get("observation_username", ""))
+            threads.setdefault(key, []).append(comment)
+
+        for (obs_date, obs_username), comments in threads.items():
+            conn.execute(
+                "DELETE FROM comments WHERE observation_date = ? AND observation_username = ?",
+                (obs_date, obs_username)
+            )
+            conn.executemany(
+                "INSERT INTO comments (observation_date, observation_username, comment_author, "
+                "author_role, comment_text, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+                [(obs_date, obs_username, c.get("comment_author", ""), c.get("author_role", ""),
+                  c.get("comment_text", ""), c.get("timestamp", "")) for c in comments]
+            )
+            stats["comments"] += len(comments)
+
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Zoo Management System SQLite storage tools")
+    parser.add_argument("command", choices=["migrate"], help="migrate: import data/observations and data/comments")
+    parser.add_argument("--db", default=os.getenv("ZOO_SQLITE_PATH", "data/zoo.db"), help="SQLite database path")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        result = migrate_json_to_sqlite(args.db)
+        print(f"Migrated {result['observations']} observations and {result['comments']} comments into {args.db}")
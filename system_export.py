@@ -0,0 +1,81 @@
+import json
+import zlib
+import argparse
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+from data_manager import data_manager, DataManager
+from auth import load_users
+
+# Observations (with their comments) read per step; bounds memory regardless of history size
+EXPORT_BATCH_SIZE = 500
+
+def iter_export_records(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                        manager: Optional[DataManager] = None) -> Iterator[Dict]:
+    """Yield export records: a header, then each observation followed by its comments, then users.
+
+    Every record carries a "type" of "export", "observation", "comment" or "user".
+    Observations are read oldest first, one batch at a time.
+    """
+    manager = manager or data_manager
+    filters = {key: value for key, value in {"start_date": start_date, "end_date": end_date}.items() if value}
+
+    yield {"type": "export", "timestamp": datetime.now().isoformat(), "filters": filters}
+
+    cursor = None
+    while True:
+        observations, cursor = manager.iter_observations(filters, order="asc", limit=EXPORT_BATCH_SIZE, cursor=cursor)
+        comments_by_obs = manager.get_comments_bulk(
+            (obs.get("date", ""), obs.get("username", "")) for obs in observations
+        )
+        for obs in observations:
+            yield {"type": "observation", **obs}
+            for comment in comments_by_obs.get((obs.get("date", ""), obs.get("username", "")), []):
+                yield {"type": "comment", **comment}
+        if cursor is None:
+            break
+
+    for role, users in load_users().items():
+        for username, password_hash in users.items():
+            yield {"type": "user", "role": role, "username": username, "password_hash": password_hash}
+
+def stream_export(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                  manager: Optional[DataManager] = None, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield the export as gzip-compressed NDJSON in chunks of roughly chunk_size bytes"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    pending = []
+    pending_size = 0
+
+    for record in iter_export_records(start_date, end_date, manager):
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        compressed = compressor.compress(line)
+        if compressed:
+            pending.append(compressed)
+            pending_size += len(compressed)
+        if pending_size >= chunk_size:
+            yield b"".join(pending)
+            pending, pending_size = [], 0
+
+    pending.append(compressor.flush())
+    yield b"".join(pending)
+
+def export_filename(start_date: Optional[str] = None, end_date: Optional[str] = None) -> str:
+    """Default file name for an export"""
+    suffix = f"_{start_date or 'start'}_to_{end_date or 'end'}" if (start_date or end_date) else ""
+    return f"zoo_system_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}.ndjson.gz"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export observations, comments and users as gzip-compressed NDJSON")
+    parser.add_argument("--start-date", help="only observations on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--end-date", help="only observations on or before this date (YYYY-MM-DD)")
+    parser.add_argument("-o", "--output", help="output file (default: zoo_system_export_<timestamp>.ndjson.gz)")
+    args = parser.parse_args()
+
+    output = args.output or export_filename(args.start_date, args.end_date)
+    written = 0
+    with open(output, "wb") as f:
+        for chunk in stream_export(args.start_date, args.end_date):
+            f.write(chunk)
+            written += len(chunk)
+    print(f"Wrote {output} ({written / 1024:.1f} KB)")
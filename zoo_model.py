@@ -1,9 +1,16 @@
 import os
-import requests
+import io
+import json
+import time
+import random
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel, Field
-from langchain.prompts import PromptTemplate
-from langchain.output_parsers import PydanticOutputParser
-import google.generativeai as genai
+from rule_extractor import extract_with_rules, is_confident
+from ai_metrics import get_ai_metrics
 
 # ----------------------------
 # Schema for structured data
@@ -25,18 +32,346 @@ class AnimalMonitoringData(BaseModel):
     medicine_stock_register: str = Field(..., description="Summary of medicine stock register")
     daily_wildlife_monitoring: str = Field(..., description="Summary of daily wildlife monitoring observations")
 
+# Stored in free-text fields the keyword rules cannot fill
+NOT_REPORTED = "Not reported"
+
+# Changes whenever the schema does, so cached results never outlive it
+SCHEMA_VERSION = hashlib.sha256(
+    json.dumps(AnimalMonitoringData.model_json_schema(), sort_keys=True).encode("utf-8")
+).hexdigest()[:16]
+
+
+# ----------------------------
+# Prompt and response schema
+# ----------------------------
+def _field_types(model):
+    """(name, type label, required, description) for each field of a pydantic model."""
+    fields = []
+    for name, info in model.model_fields.items():
+        label = "bool" if info.annotation is bool else "text"
+        if not info.is_required():
+            label += " or null"
+        fields.append((name, label, info.is_required(), info.description or ""))
+    return fields
+
+def build_response_schema(model):
+    """Compact Gemini response schema (OpenAPI subset) for a flat pydantic model."""
+    fields = _field_types(model)
+    return {
+        "type": "object",
+        "properties": {
+            name: {"type": "boolean" if label.startswith("bool") else "string", "nullable": not required}
+            for name, label, required, _ in fields
+        },
+        "required": [name for name, _, required, _ in fields if required],
+    }
+
+def build_prompt_prefix(model):
+    """Static instructions shared by every extraction: one line per field instead of a JSON schema dump."""
+    lines = [
+        "You are an animal monitoring assistant. Read the zoo keeper's observation (Hindi or English)",
+        "and return one JSON object with these fields:",
+    ]
+    lines += [f"- {name} ({label}): {description}" for name, label, _, description in _field_types(model)]
+    lines.append("Return only the JSON object.")
+    return "\n".join(lines) + "\n\n"
+
+# Built once; each request only appends the date and the observation
+RESPONSE_SCHEMA = build_response_schema(AnimalMonitoringData)
+PROMPT_PREFIX = build_prompt_prefix(AnimalMonitoringData)
+
+def build_prompt(observation_text, date):
+    """Full extraction prompt for one observation."""
+    return f"{PROMPT_PREFIX}Date: {date}\nObservation: {observation_text}"
+
+def parse_response(json_text):
+    """Validate a Gemini JSON reply (tolerating a ```json fence) into AnimalMonitoringData."""
+    text = json_text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+    return AnimalMonitoringData.model_validate_json(text)
+
+
+# ----------------------------
+# Persistent LLM response cache
+# ----------------------------
+class LLMResponseCache:
+    """Parsed Gemini results on disk (SQLite), evicted least recently used first."""
+
+    def __init__(self, db_path="data/llm_cache.db", max_entries=5000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used)")
+
+    def _connection(self):
+        """Get (or open) the connection for the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def make_key(prompt, model_name):
+        """Hash of the rendered prompt, model name and schema version."""
+        material = "\0".join([model_name, SCHEMA_VERSION, prompt])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Cached result for key, or None."""
+        try:
+            with self._connection() as conn:
+                row = conn.execute("SELECT value FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+            return AnimalMonitoringData.model_validate_json(row[0])
+        except Exception as e:
+            print(f"Error reading LLM cache: {e}")
+            return None
+
+    def put(self, key, result):
+        """Store a parsed result, evicting the least recently used entries past max_entries."""
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, last_used) VALUES (?, ?, ?)",
+                    (key, result.model_dump_json(), time.time())
+                )
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    "SELECT key FROM llm_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+        except Exception as e:
+            print(f"Error writing LLM cache: {e}")
+
+
+# ----------------------------
+# Audio preprocessing
+# ----------------------------
+TARGET_SAMPLE_RATE = 16000
+
+# Encodings offered for upload -> (soundfile format, subtype, content type)
+AUDIO_ENCODINGS = {
+    "flac": ("FLAC", "PCM_16", "audio/flac"),
+    "ogg": ("OGG", "VORBIS", "audio/ogg"),
+    "wav": ("WAV", "PCM_16", "audio/wav"),
+}
+
+def sniff_content_type(audio_bytes):
+    """Guess the content type of an audio payload from its magic bytes."""
+    if audio_bytes[:4] == b"RIFF":
+        return "audio/wav"
+    if audio_bytes[:4] == b"fLaC":
+        return "audio/flac"
+    if audio_bytes[:4] == b"OggS":
+        return "audio/ogg"
+    if audio_bytes[:4] == b"\x1aE\xdf\xa3":
+        return "audio/webm"
+    if audio_bytes[:3] == b"ID3" or audio_bytes[:2] == b"\xff\xfb":
+        return "audio/mpeg"
+    return "application/octet-stream"
+
+def trim_silence(samples, sample_rate, threshold_db=-40.0, frame_ms=20, padding_ms=150):
+    """Drop leading and trailing frames quieter than threshold_db below the peak frame."""
+    import numpy as np
+
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    frame_count = len(samples) // frame
+    if frame_count == 0:
+        return samples
+
+    rms = np.sqrt(np.mean(samples[:frame_count * frame].reshape(frame_count, frame) ** 2, axis=1))
+    peak = rms.max()
+    if peak <= 0:
+        return samples
+
+    loud = np.flatnonzero(rms >= peak * (10 ** (threshold_db / 20)))
+    padding = int(sample_rate * padding_ms / 1000)
+    start = max(0, loud[0] * frame - padding)
+    end = min(len(samples), (loud[-1] + 1) * frame + padding)
+    return samples[start:end]
+
+def preprocess_audio(audio_bytes, encoding="flac", sample_rate=TARGET_SAMPLE_RATE):
+    """Downmix to mono, resample, trim silence and re-encode audio for upload.
+
+    Returns (payload, content_type). Audio that cannot be decoded is passed
+    through unchanged with its sniffed content type.
+    """
+    try:
+        import numpy as np
+        import soundfile as sf
+        from math import gcd
+        from scipy.signal import resample_poly
+
+        samples, source_rate = sf.read(io.BytesIO(audio_bytes), dtype="float32", always_2d=True)
+        samples = samples.mean(axis=1)
+
+        if source_rate != sample_rate:
+            divisor = gcd(source_rate, sample_rate)
+            samples = resample_poly(samples, sample_rate // divisor, source_rate // divisor).astype(np.float32)
+
+        samples = trim_silence(samples, sample_rate)
+
+        file_format, subtype, content_type = AUDIO_ENCODINGS.get(encoding, AUDIO_ENCODINGS["flac"])
+        buffer = io.BytesIO()
+        sf.write(buffer, np.clip(samples, -1.0, 1.0), sample_rate, format=file_format, subtype=subtype)
+        return buffer.getvalue(), content_type
+
+    except Exception as e:
+        print(f"Audio preprocessing skipped: {e}")
+        return audio_bytes, sniff_content_type(audio_bytes)
+
+
+# ----------------------------
+# Pooled HTTP client with retries
+# ----------------------------
+class PooledHTTPClient:
+    """Keep-alive HTTP session with bounded timeouts and jittered exponential backoff.
+
+    Retries connection errors, timeouts, 429 and 5xx responses; records per-call
+    latency and retry counts.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, connect_timeout=5.0, read_timeout=60.0, max_retries=3,
+                 backoff_base=0.5, backoff_max=8.0, pool_size=10, metrics=None, metrics_name="http"):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.metrics = metrics
+        self.metrics_name = metrics_name
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._stats_lock = threading.Lock()
+        self._calls = 0
+        self._retries = 0
+        self._failures = 0
+        self._recent = deque(maxlen=200)  # (latency_ms, retries) of recent calls
+
+    def _backoff(self, attempt, response=None):
+        """Seconds to wait before retry number attempt (full jitter, honours Retry-After)."""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _record(self, started, retries, failed):
+        """Add one finished call to the stats."""
+        latency_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self._calls += 1
+            self._retries += retries
+            self._failures += int(failed)
+            self._recent.append((latency_ms, retries))
+
+        if self.metrics is not None:
+            self.metrics.observe(f"{self.metrics_name}.network_ms", latency_ms)
+            self.metrics.increment(f"{self.metrics_name}.retries", retries)
+
+    def post(self, url, **kwargs):
+        """POST with retries; returns the final response (raise_for_status is left to the caller)."""
+        import requests
+
+        started = time.perf_counter()
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            try:
+                response = self.session.post(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    self._record(started, attempt, failed=True)
+                    raise
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in self.RETRY_STATUSES and attempt < self.max_retries:
+                time.sleep(self._backoff(attempt, response))
+                attempt += 1
+                continue
+
+            self._record(started, attempt, failed=not response.ok)
+            return response
+
+    def get_stats(self):
+        """Call count, retries, failures and latency percentiles over recent calls."""
+        with self._stats_lock:
+            recent = list(self._recent)
+            stats = {"calls": self._calls, "retries": self._retries, "failures": self._failures}
+
+        latencies = sorted(latency for latency, _ in recent)
+        if latencies:
+            stats["last_latency_ms"] = recent[-1][0]
+            stats["last_retries"] = recent[-1][1]
+            stats["p50_latency_ms"] = latencies[len(latencies) // 2]
+            stats["p95_latency_ms"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        return stats
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart, across threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self):
+        """Block until the caller may make its next call."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
 
 # ----------------------------
 # Zoo AI Model with Deepgram
 # ----------------------------
 class ZooAIModel:
+    # Transcripts kept in memory, keyed by audio content hash + language
+    TRANSCRIPT_CACHE_SIZE = 128
+
     def __init__(self):
         """Initialize Gemini LLM and Deepgram API."""
         # Gemini LLM - Load from environment variable
         gem_key =os.getenv("GOOGLE_API_KEY", "")
+        self.model_name = "gemini-2.5-flash"
         if gem_key:
+            # The Gemini SDK is slow to import, so it is only loaded when a model is built
+            import google.generativeai as genai
             genai.configure(api_key=gem_key)
-            self.llm = genai.GenerativeModel("gemini-2.5-flash")
+            # Native JSON mode constrained to the schema: the prompt no longer has to carry it
+            self.llm = genai.GenerativeModel(
+                self.model_name,
+                generation_config={"response_mime_type": "application/json", "response_schema": RESPONSE_SCHEMA},
+            )
 
         else:
             self.llm = None
@@ -47,44 +382,82 @@ class ZooAIModel:
         self.deepgram_url = "https://api.deepgram.com/v1/listen"
         if not self.deepgram_key:
             print("ℹ️  DEEPGRAM_API_KEY not set. Audio transcription will be unavailable.")
+        self._deepgram_http = None
+        self._deepgram_http_lock = threading.Lock()
 
-        # Parser & prompt
-        self.parser = PydanticOutputParser(pydantic_object=AnimalMonitoringData)
-        self.prompt = PromptTemplate(
-            template="""
-                You are an animal monitoring assistant.
-                Given the input observation, return structured monitoring data
-                in valid JSON format that matches the schema.
-
-                {format_instructions}
+        # Per-stage timings, sizes, cache hits and failure reasons (admin "AI Performance")
+        self.metrics = get_ai_metrics()
 
-                ONLY return a JSON object, no extra text, no code, no comments.
+        # Routine reports whose checklist the keyword rules settle with at least
+        # this confidence skip Gemini entirely (a value above 1 disables the fast path)
+        self.fast_path_confidence = float(os.getenv("ZOO_FAST_PATH_CONFIDENCE", "0.8"))
 
-                Observation: {observation}
-            """,
-            input_variables=["observation"],
-            partial_variables={"format_instructions": self.parser.get_format_instructions()},
+        # Identical prompts are answered from disk instead of Gemini
+        self.llm_cache = LLMResponseCache(
+            os.getenv("ZOO_LLM_CACHE_PATH", "data/llm_cache.db"),
+            max_entries=int(os.getenv("ZOO_LLM_CACHE_SIZE", "5000"))
         )
 
+        # Identical audio (retries, edits) is never sent to Deepgram twice
+        self._transcript_cache = OrderedDict()
+        self._transcript_cache_lock = threading.Lock()
+
     # ----------------------------
     # Deepgram Transcription
     # ----------------------------
+    @staticmethod
+    def _transcript_key(audio_bytes, language):
+        """Cache key for a transcript: SHA-256 of the audio content plus language."""
+        return f"{hashlib.sha256(audio_bytes).hexdigest()}:{language}"
+
+    def _get_deepgram_http(self):
+        """Shared keep-alive client for Deepgram, configured from the environment."""
+        with self._deepgram_http_lock:
+            if self._deepgram_http is None:
+                self._deepgram_http = PooledHTTPClient(
+                    connect_timeout=float(os.getenv("DEEPGRAM_CONNECT_TIMEOUT", "5")),
+                    read_timeout=float(os.getenv("DEEPGRAM_READ_TIMEOUT", "60")),
+                    max_retries=int(os.getenv("DEEPGRAM_MAX_RETRIES", "3")),
+                    metrics=self.metrics,
+                    metrics_name="transcribe",
+                )
+        return self._deepgram_http
+
+    def get_transcription_stats(self):
+        """Deepgram call latency and retry statistics."""
+        if self._deepgram_http is None:
+            return {"calls": 0, "retries": 0, "failures": 0}
+        return self._deepgram_http.get_stats()
+
     def transcribe_audio(self, audio_bytes, language="hi"):
-        """Transcribe audio using Deepgram API."""
+        """Transcribe audio using Deepgram API (cached by audio content)."""
         if not self.deepgram_key:
             return "Audio transcription unavailable - Deepgram API key missing"
 
+        cache_key = self._transcript_key(audio_bytes, language)
+        with self._transcript_cache_lock:
+            if cache_key in self._transcript_cache:
+                self._transcript_cache.move_to_end(cache_key)
+                self.metrics.increment("transcript_cache.hit")
+                return self._transcript_cache[cache_key]
+        self.metrics.increment("transcript_cache.miss")
+
+        # Mono 16 kHz FLAC (by default) is a fraction of the size of a raw recording
+        with self.metrics.timer("transcribe.preprocess_ms"):
+            payload, content_type = preprocess_audio(audio_bytes, os.getenv("ZOO_AUDIO_ENCODING", "flac"))
+        self.metrics.observe("transcribe.audio_bytes", len(audio_bytes))
+        self.metrics.observe("transcribe.upload_bytes", len(payload))
+
         headers = {
             "Authorization": f"Token {self.deepgram_key}",
-            "Content-Type": "audio/wav",  # assumes WAV upload
+            "Content-Type": content_type,
         }
 
         try:
-            response = requests.post(
+            response = self._get_deepgram_http().post(
                 self.deepgram_url,
                 headers=headers,
-                data=audio_bytes,
-                timeout=60,
+                data=payload,
                 params={"language": language}
             )
             response.raise_for_status()
@@ -96,60 +469,187 @@ class ZooAIModel:
                       .get("alternatives", [{}])[0]
                       .get("transcript", "")
             )
-            return transcript or "No text returned by Deepgram"
+            transcript = transcript or "No text returned by Deepgram"
+            self.metrics.observe("transcribe.transcript_chars", len(transcript))
+
+            # Only successful responses are cached; errors are retried next time
+            with self._transcript_cache_lock:
+                self._transcript_cache[cache_key] = transcript
+                self._transcript_cache.move_to_end(cache_key)
+                while len(self._transcript_cache) > self.TRANSCRIPT_CACHE_SIZE:
+                    self._transcript_cache.popitem(last=False)
+            return transcript
 
         except Exception as e:
             print("Error transcribing audio:", e)
+            self.metrics.increment(f"transcribe.failure.{self._failure_reason(e)}")
             return f"Error in audio transcription: {str(e)}"
 
     # ----------------------------
     # Gemini Processing
     # ----------------------------
-    def process_observation(self, observation_text, date):
-        """Convert text observation into structured data using Gemini."""
-        try:
-            if not self.llm:
-                return self._create_fallback_data(observation_text, date)
+    def _extract(self, observation_text, date):
+        """Run one Gemini extraction; raises on any failure."""
+        if not self.llm:
+            raise RuntimeError("Gemini model not configured")
 
-            enhanced_observation = f"Date: {date}\nObservation: {observation_text}"
-            response = self.llm.generate_content(
-                self.prompt.format(observation=enhanced_observation)
-            )
+        metrics = self.metrics
+        with metrics.timer("extract.prompt_build_ms"):
+            prompt = build_prompt(observation_text, date)
+        metrics.observe("extract.prompt_chars", len(prompt))
 
-            json_text = getattr(response, "text", None) or ""
-            result = self.parser.parse(json_text)
+        cache_key = self.llm_cache.make_key(prompt, self.model_name)
+        cached = self.llm_cache.get(cache_key)
+        if cached is not None:
+            metrics.increment("llm_cache.hit")
+            return cached
+        metrics.increment("llm_cache.miss")
 
-            if hasattr(result, "date_or_day"):
-                result.date_or_day = date
+        with metrics.timer("extract.network_ms"):
+            response = self.llm.generate_content(prompt)
 
-            return result
+        json_text = getattr(response, "text", None) or ""
+        metrics.observe("extract.response_chars", len(json_text))
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            metrics.observe("extract.prompt_tokens", getattr(usage, "prompt_token_count", 0) or 0)
+            metrics.observe("extract.response_tokens", getattr(usage, "candidates_token_count", 0) or 0)
 
-        except Exception as e:
-            print(f"Error processing observation: {e}")
+        with metrics.timer("extract.parse_ms"):
+            result = parse_response(json_text)
+
+        if hasattr(result, "date_or_day"):
+            result.date_or_day = date
+
+        self.llm_cache.put(cache_key, result)
+        return result
+
+    @staticmethod
+    def _failure_reason(error):
+        """Short failure label for metrics: HTTP status or exception class."""
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+        return f"http_{status}" if status else type(error).__name__
+
+    def _fast_path(self, observation_text, date):
+        """Rule-based result if the keyword rules are confident enough, else None."""
+        with self.metrics.timer("extract.rules_ms"):
+            extraction = extract_with_rules(observation_text)
+        if is_confident(extraction, self.fast_path_confidence):
+            self.metrics.increment("fast_path.hit")
+            return self._create_rules_data(date, extraction)
+        self.metrics.increment("fast_path.miss")
+        return None
+
+    def _fallback(self, observation_text, date, reason):
+        """Rule-based fallback data, counted and timed."""
+        self.metrics.increment(f"extract.fallback.{reason}")
+        with self.metrics.timer("extract.fallback_ms"):
             return self._create_fallback_data(observation_text, date)
 
+    def _process(self, observation_text, date, rate_limiter=None, use_fast_path=True):
+        """Keyword rules, then Gemini, then fallback; returns the outcome dict used by the batch API."""
+        with self.metrics.timer("extract.total_ms"):
+            fast_result = self._fast_path(observation_text, date) if use_fast_path else None
+            if fast_result is not None:
+                return {"result": fast_result, "source": "rules", "fallback": False, "error": None}
+
+            if not self.llm:
+                return {"result": self._fallback(observation_text, date, "no_model"),
+                        "source": "fallback", "fallback": True, "error": "Gemini model not configured"}
+
+            try:
+                if rate_limiter is not None:
+                    rate_limiter.wait()
+                return {"result": self._extract(observation_text, date),
+                        "source": "llm", "fallback": False, "error": None}
+            except Exception as e:
+                print(f"Error processing observation for {date}: {e}")
+                self.metrics.increment(f"extract.failure.{self._failure_reason(e)}")
+                return {"result": self._fallback(observation_text, date, "error"),
+                        "source": "fallback", "fallback": True, "error": str(e)}
+
+    def process_observation(self, observation_text, date):
+        """Convert text observation into structured data (keyword rules first, then Gemini)."""
+        return self._process(observation_text, date)["result"]
+
+    def process_observations_batch(self, items, max_concurrency=8, rate_limiter=None, use_fast_path=True):
+        """Extract many (observation_text, date) items in parallel.
+
+        rate_limiter (a RateLimiter) paces the Gemini calls; use_fast_path=False
+        sends every item to Gemini even when the keyword rules are confident.
+
+        Returns one dict per item, in input order, with the structured "result",
+        its "source" ("rules", "llm" or "fallback"), whether it is "fallback" data,
+        and the "error" message if extraction failed.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        def run(item):
+            observation_text, date = item
+            return self._process(observation_text, date, rate_limiter, use_fast_path)
+
+        # Bounded pool: at most max_concurrency Gemini calls in flight; map keeps input order
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(items)))) as executor:
+            return list(executor.map(run, items))
+
     def process_audio_observation(self, audio_bytes, date, language="hi"):
-        """Transcribe audio and process observation."""
+        """Transcribe audio once and process observation; returns (transcript, structured data).
+
+        Raises RuntimeError if transcription fails, so the caller keeps the recording
+        instead of storing an error message as the observation.
+        """
         text = self.transcribe_audio(audio_bytes, language)
         if text.startswith("Error") or text.startswith("Audio transcription unavailable"):
-            return self._create_fallback_data(text, date)
-        return self.process_observation(text, date)
+            raise RuntimeError(text)
+        return text, self.process_observation(text, date)
 
     # ----------------------------
     # Fallback Data
     # ----------------------------
-    def _create_fallback_data(self, observation_text, date):
-        """Return fallback structured data if LLM or transcription fails."""
+    def _create_rules_data(self, date, extraction):
+        """Build structured data from confident keyword rules (fast path).
+
+        The rules only cover the checklist, so free-text fields the report
+        did not fill are stored as NOT_REPORTED rather than invented.
+        """
+        values = extraction["values"]
+
         return AnimalMonitoringData(
-            animal_name="Animal (please specify)",
+            animal_name=values["animal_name"],
             date_or_day=date,
-            animal_observed_on_time=True,
-            clean_drinking_water_provided=True,
-            enclosure_cleaned_properly=True,
-            normal_behaviour_status=True,
+            animal_observed_on_time=values["animal_observed_on_time"],
+            clean_drinking_water_provided=values["clean_drinking_water_provided"],
+            enclosure_cleaned_properly=values["enclosure_cleaned_properly"],
+            normal_behaviour_status=values["normal_behaviour_status"],
             normal_behaviour_details=None,
-            feed_and_supplements_available=True,
-            feed_given_as_prescribed=True,
+            feed_and_supplements_available=values["feed_and_supplements_available"],
+            feed_given_as_prescribed=values["feed_given_as_prescribed"],
+            other_animal_requirements=None,
+            incharge_signature=NOT_REPORTED,
+            daily_animal_health_monitoring=NOT_REPORTED,
+            carnivorous_animal_feeding_chart=NOT_REPORTED,
+            medicine_stock_register=NOT_REPORTED,
+            daily_wildlife_monitoring=NOT_REPORTED
+        )
+
+    def _create_fallback_data(self, observation_text, date):
+        """Build placeholder structured data when the LLM or transcription fails."""
+        extraction = extract_with_rules(observation_text)
+        values = extraction["values"]
+
+        return AnimalMonitoringData(
+            animal_name=values["animal_name"] or "Animal (please specify)",
+            date_or_day=date,
+            animal_observed_on_time=values["animal_observed_on_time"],
+            clean_drinking_water_provided=values["clean_drinking_water_provided"],
+            enclosure_cleaned_properly=values["enclosure_cleaned_properly"],
+            normal_behaviour_status=values["normal_behaviour_status"],
+            normal_behaviour_details=extraction["abnormal_details"],
+            feed_and_supplements_available=values["feed_and_supplements_available"],
+            feed_given_as_prescribed=values["feed_given_as_prescribed"],
             other_animal_requirements=(observation_text[:200] + "..." 
                                        if len(observation_text) > 200 else observation_text),
             incharge_signature="Zoo Keeper",
@@ -160,5 +660,21 @@ class ZooAIModel:
         )
 
 
-# Instantiate global model
-zoo_model = ZooAIModel()
+# Global model, built on first use
+_zoo_model = None
+_zoo_model_lock = threading.Lock()
+
+def get_zoo_model():
+    """Get the shared ZooAIModel, constructing it on first call."""
+    global _zoo_model
+    if _zoo_model is None:
+        with _zoo_model_lock:
+            if _zoo_model is None:
+                _zoo_model = ZooAIModel()
+    return _zoo_model
+
+def __getattr__(name):
+    """Keep `from zoo_model import zoo_model` working without building the model at import."""
+    if name == "zoo_model":
+        return get_zoo_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")